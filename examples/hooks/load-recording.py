@@ -4,6 +4,7 @@ SessionStart hook for Claude Code that loads the latest ultraplan recording.
 
 Install: Copy to .claude/hooks/ and configure in settings.json
 """
+import os
 import sys
 import json
 from pathlib import Path
@@ -17,13 +18,23 @@ def find_latest_session() -> Path | None:
     if not ULTRAPLAN_DIR.exists():
         return None
 
-    sessions = sorted(ULTRAPLAN_DIR.glob("session_*"))
-    return sessions[-1] if sessions else None
+    # Session names sort chronologically, so the latest is the max name
+    latest = None
+    with os.scandir(ULTRAPLAN_DIR) as entries:
+        for entry in entries:
+            if entry.name.startswith("session_") and (latest is None or entry.name > latest):
+                latest = entry.name
+    return ULTRAPLAN_DIR / latest if latest else None
 
 
 def get_screenshot_list(session_dir: Path) -> list[str]:
     """Get list of screenshot filenames in the session."""
-    return sorted([f.name for f in session_dir.glob("img_*.png")])
+    with os.scandir(session_dir) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.name.startswith("img_") and entry.name.endswith(".png")
+        )
 
 
 def main():
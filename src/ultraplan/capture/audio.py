@@ -1,14 +1,29 @@
 """System audio capture using sounddevice."""
 
-import queue
+import time
 from typing import Optional
 
 import numpy as np
 import sounddevice as sd
 
+# Resolved device indices by requested name, so restarting a session skips
+# re-enumerating every PortAudio device
+_DEVICE_INDEX_CACHE: dict[str, int] = {}
+
 
 class AudioCapture:
-    """Captures system audio using sounddevice (PortAudio bindings)."""
+    """Captures system audio using sounddevice (PortAudio bindings).
+
+    The PortAudio callback writes into a preallocated ring buffer and only
+    advances a write index, so it never allocates or takes a lock. There is
+    exactly one producer (the callback) and one consumer (``get_chunk``);
+    each index is only ever written by its own side.
+
+    The consumer also runs transcription, which can take several seconds per
+    window with the larger Whisper models on CPU, so the ring holds a minute
+    of audio by default. If the consumer still falls more than a ring behind,
+    the oldest audio is lost; ``dropped_frames`` counts it.
+    """
 
     def __init__(
         self,
@@ -16,22 +31,33 @@ class AudioCapture:
         sample_rate: int = 16000,
         channels: int = 1,
         chunk_duration: float = 0.5,  # seconds
+        ring_duration: float = 60.0,  # Ring capacity, in seconds
     ):
         self.device = device
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = int(sample_rate * chunk_duration)
-        self.audio_queue: queue.Queue[np.ndarray] = queue.Queue()
         self.stream: Optional[sd.InputStream] = None
 
+        # Ring buffer state: indices are total frames written/read and only grow
+        ring_size = max(int(sample_rate * ring_duration), self.chunk_size)
+        self._ring = np.empty((ring_size, channels), dtype=np.float32)
+        self._write_idx = 0
+        self._read_idx = 0
+        self.dropped_frames = 0  # Frames overwritten before get_chunk read them
+
+        # Reused output buffer for get_chunk (never larger than the ring)
+        self._chunk_buf = np.empty_like(self._ring)
+
     def _find_device_index(self) -> Optional[int]:
         """Find the device index by name."""
         if self.device is None:
             return None
 
-        devices = sd.query_devices()
-        for i, d in enumerate(devices):
-            if self.device.lower() in d["name"].lower() and d["max_input_channels"] > 0:
+        needle = self.device.casefold()
+        for i, d in enumerate(sd.query_devices()):
+            # Check input channels first; it's cheaper than folding the name
+            if d["max_input_channels"] > 0 and needle in d["name"].casefold():
                 return i
 
         return None
@@ -41,12 +67,25 @@ class AudioCapture:
         if status:
             # Log status but don't crash
             pass
-        # Copy data to queue for processing
-        self.audio_queue.put(indata.copy())
+        # Copy data into the ring (split in two if it wraps around the end)
+        size = len(self._ring)
+        w = self._write_idx
+        start = w % size
+        first = min(frames, size - start)
+        self._ring[start : start + first] = indata[:first]
+        if first < frames:
+            self._ring[: frames - first] = indata[first:frames]
+        self._write_idx = w + frames
 
     def start(self):
         """Start audio capture."""
-        device_index = self._find_device_index()
+        device_index = None
+        if self.device is not None:
+            device_index = _DEVICE_INDEX_CACHE.get(self.device)
+            if device_index is None:
+                device_index = self._find_device_index()
+                if device_index is not None:
+                    _DEVICE_INDEX_CACHE[self.device] = device_index
 
         self.stream = sd.InputStream(
             device=device_index,
@@ -66,11 +105,42 @@ class AudioCapture:
             self.stream = None
 
     def get_chunk(self, timeout: float = 1.0) -> Optional[np.ndarray]:
-        """Get an audio chunk from the queue.
+        """Get all audio captured since the last call.
 
-        Returns None if no chunk is available within timeout.
+        Waits until at least one chunk is available. Returns None if no audio
+        arrives within timeout.
+
+        The returned array is a view into a buffer that is reused by the next
+        call, so copy it if it needs to outlive that.
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        deadline = time.monotonic() + timeout
+        while True:
+            available = self._write_idx - self._read_idx
+            if available >= self.chunk_size:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if available:
+                    break
+                return None
+            # Sleep roughly until the missing frames should have arrived
+            missing = (self.chunk_size - available) / self.sample_rate
+            time.sleep(min(missing, remaining))
+
+        size = len(self._ring)
+        w = self._write_idx
+        r = self._read_idx
+        if w - r > size:
+            # Consumer fell behind and the oldest audio was overwritten
+            self.dropped_frames += w - size - r
+            r = w - size
+
+        start = r % size
+        n = w - r
+        first = min(n, size - start)
+        chunk = self._chunk_buf[:n]
+        chunk[:first] = self._ring[start : start + first]
+        if first < n:
+            chunk[first:] = self._ring[: n - first]
+        self._read_idx = w
+        return chunk
@@ -1,91 +1,188 @@
-"""Clipboard monitoring using pyperclip and macOS native APIs for images."""
+"""Clipboard monitoring using macOS native APIs, with pyperclip as a text fallback."""
 
-import hashlib
 import threading
 import time
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 import pyperclip
 
+try:
+    from AppKit import (
+        NSBitmapImageRep,
+        NSPasteboard,
+        NSPasteboardTypePNG,
+        NSPasteboardTypeString,
+        NSPasteboardTypeTIFF,
+    )
 
-def _get_clipboard_image_data() -> Optional[bytes]:
-    """Get image data from clipboard using macOS native APIs.
+    _HAS_APPKIT = True
+except ImportError:
+    # AppKit not available (not macOS or pyobjc not installed)
+    _HAS_APPKIT = False
 
-    Returns PNG data if clipboard contains an image, None otherwise.
+
+def _get_general_pasteboard() -> Optional[Any]:
+    """Get the macOS general pasteboard, or None if AppKit is unavailable."""
+    if not _HAS_APPKIT:
+        return None
+    return NSPasteboard.generalPasteboard()
+
+
+def _get_clipboard_text(pasteboard: Optional[Any] = None) -> Optional[str]:
+    """Get text from clipboard.
+
+    Reads NSPasteboard in-process on macOS; falls back to pyperclip (which
+    shells out to pbpaste/xclip) when AppKit is unavailable.
     """
-    try:
-        from AppKit import NSPasteboard, NSPasteboardTypePNG, NSPasteboardTypeTIFF
+    if not _HAS_APPKIT:
+        return pyperclip.paste()
 
+    if pasteboard is None:
         pasteboard = NSPasteboard.generalPasteboard()
+    text = pasteboard.stringForType_(NSPasteboardTypeString)
+    return str(text) if text is not None else None
+
+
+def _get_clipboard_image_raw(pasteboard: Optional[Any] = None) -> Optional[tuple[str, bytes]]:
+    """Get raw image data from clipboard using macOS native APIs.
+
+    Returns ("png" | "tiff", bytes) as stored on the pasteboard, without any
+    conversion, or None if the clipboard doesn't contain an image.
+    """
+    if not _HAS_APPKIT:
+        return None
+
+    try:
+        if pasteboard is None:
+            pasteboard = NSPasteboard.generalPasteboard()
+
+        # Pick the reader from the advertised types instead of probing each one
+        types = pasteboard.types() or ()
 
         # Try PNG first, then TIFF
-        for img_type in [NSPasteboardTypePNG, NSPasteboardTypeTIFF]:
+        for img_type, tag in [(NSPasteboardTypePNG, "png"), (NSPasteboardTypeTIFF, "tiff")]:
+            if img_type not in types:
+                continue
             data = pasteboard.dataForType_(img_type)
             if data:
-                # Convert to PNG if needed
-                if img_type == NSPasteboardTypeTIFF:
-                    from AppKit import NSBitmapImageRep
-
-                    rep = NSBitmapImageRep.imageRepWithData_(data)
-                    if rep:
-                        png_data = rep.representationUsingType_properties_(4, None)  # 4 = PNG
-                        if png_data:
-                            return bytes(png_data)
-                else:
-                    return bytes(data)
-        return None
-    except ImportError:
-        # AppKit not available (not macOS or pyobjc not installed)
+                return tag, bytes(data)
         return None
     except Exception:
         # Clipboard may be locked or contain unsupported data
         return None
 
 
+def _ensure_png(image_type: str, data: bytes) -> Optional[bytes]:
+    """Convert raw clipboard image data to PNG if needed.
+
+    Returns PNG data, or None if the image can't be converted.
+    """
+    if image_type == "png":
+        return data
+    if not _HAS_APPKIT:
+        return None
+
+    try:
+        rep = NSBitmapImageRep.imageRepWithData_(data)  # bytes are bridged to NSData
+        if rep:
+            png_data = rep.representationUsingType_properties_(4, None)  # 4 = PNG
+            if png_data:
+                return bytes(png_data)
+        return None
+    except Exception:
+        # The image couldn't be decoded
+        return None
+
+
 class ClipboardMonitor:
-    """Monitors clipboard for content changes (text and images)."""
+    """Monitors clipboard for content changes (text and images).
+
+    On macOS the pasteboard's changeCount is polled, which is a cheap integer
+    read; clipboard contents are only fetched when it changes. Elsewhere the
+    contents are fetched on every poll.
+
+    While the clipboard is idle the poll interval backs off gradually, up to
+    max_poll_interval, and snaps back to poll_interval on the next change.
+    """
 
     def __init__(
         self,
         on_change: Optional[Callable[[str, int], None]] = None,
         on_image: Optional[Callable[[bytes, int], None]] = None,
         poll_interval: float = 0.5,
+        max_poll_interval: float = 2.0,
     ):
         self.on_change = on_change
         self.on_image = on_image
         self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
         self.running = threading.Event()
+        self._stop_event = threading.Event()  # Wakes the poll loop early on stop()
         self.last_content: str = ""
-        self.last_image_hash: str = ""
+        self.last_image: bytes = b""
         self.start_time: float = 0
         self.thread: Optional[threading.Thread] = None
+        self._pasteboard: Optional[Any] = None
+        self._last_change_count: int = -1
+
+    def _has_changed(self) -> bool:
+        """Check whether the clipboard may have changed since the last poll."""
+        if self._pasteboard is None:
+            return True
+        change_count = self._pasteboard.changeCount()
+        if change_count == self._last_change_count:
+            return False
+        self._last_change_count = change_count
+        return True
+
+    def _check_clipboard(self) -> bool:
+        """Read the clipboard and report new text or image content.
+
+        Returns True if new content was found.
+        """
+        # Check for image first
+        image = _get_clipboard_image_raw(self._pasteboard)
+        if image:
+            # Compare the raw pasteboard bytes against the previous image:
+            # bytes equality checks the length first and then memcmp's, so no
+            # hashing or PNG re-encoding happens unless the image changed
+            image_type, raw_data = image
+            if raw_data != self.last_image:
+                timestamp_ms = int((time.time() - self.start_time) * 1000)
+                self.last_image = raw_data
+                if self.on_image:
+                    png_data = _ensure_png(image_type, raw_data)
+                    if png_data:
+                        self.on_image(png_data, timestamp_ms)
+                return True
+        else:
+            # Check for text
+            current = _get_clipboard_text(self._pasteboard)
+            if current and current != self.last_content:
+                timestamp_ms = int((time.time() - self.start_time) * 1000)
+                self.last_content = current
+                if self.on_change:
+                    self.on_change(current, timestamp_ms)
+                return True
+        return False
 
     def _monitor_loop(self):
         """Poll clipboard for changes."""
+        interval = self.poll_interval
         while self.running.is_set():
+            changed = False
             try:
-                # Check for image first
-                image_data = _get_clipboard_image_data()
-                if image_data:
-                    # Use hash to detect changes (avoid comparing large byte arrays)
-                    img_hash = hashlib.md5(image_data).hexdigest()
-                    if img_hash != self.last_image_hash:
-                        timestamp_ms = int((time.time() - self.start_time) * 1000)
-                        self.last_image_hash = img_hash
-                        if self.on_image:
-                            self.on_image(image_data, timestamp_ms)
-                else:
-                    # Check for text
-                    current = pyperclip.paste()
-                    if current and current != self.last_content:
-                        timestamp_ms = int((time.time() - self.start_time) * 1000)
-                        self.last_content = current
-                        if self.on_change:
-                            self.on_change(current, timestamp_ms)
+                changed = self._has_changed() and self._check_clipboard()
             except Exception:
                 # Clipboard may be locked or contain unsupported data
                 pass
-            time.sleep(self.poll_interval)
+
+            # Back off while idle; poll quickly again right after a change
+            if changed:
+                interval = self.poll_interval
+            else:
+                interval = min(interval * 1.25, self.max_poll_interval)
+            self._stop_event.wait(interval)
 
     def start(self, start_time: float):
         """Start clipboard monitoring.
@@ -94,22 +191,25 @@ class ClipboardMonitor:
             start_time: Session start time (time.time()) for timestamp calculation.
         """
         self.start_time = start_time
+        self._pasteboard = _get_general_pasteboard()
+        if self._pasteboard is not None:
+            self._last_change_count = self._pasteboard.changeCount()
 
         # Get initial clipboard state to avoid triggering on existing content
         try:
-            self.last_content = pyperclip.paste() or ""
+            self.last_content = _get_clipboard_text(self._pasteboard) or ""
         except Exception:
             self.last_content = ""
 
-        # Get initial image hash
+        # Get initial image
         try:
-            image_data = _get_clipboard_image_data()
-            if image_data:
-                self.last_image_hash = hashlib.md5(image_data).hexdigest()
+            image = _get_clipboard_image_raw(self._pasteboard)
+            self.last_image = image[1] if image else b""
         except Exception:
-            # Clipboard access may fail; continue with empty hash
-            pass
+            # Clipboard access may fail; continue with no image
+            self.last_image = b""
 
+        self._stop_event.clear()
         self.running.set()
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.thread.start()
@@ -117,6 +217,7 @@ class ClipboardMonitor:
     def stop(self):
         """Stop clipboard monitoring."""
         self.running.clear()
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=1.0)
             self.thread = None
@@ -1,6 +1,7 @@
 """Keystroke capture with hotkey detection using pynput."""
 
 import time
+from collections import deque
 from typing import Callable, Optional
 
 from pynput import keyboard
@@ -21,12 +22,15 @@ class KeyboardCapture:
         self.on_hotkey = on_hotkey
         self.hotkey_timeout = hotkey_timeout
         self.hotkey_screenshot = hotkey_screenshot
+        self._hotkey_len = len(hotkey_screenshot)
+        self._hotkey_tuple = tuple(hotkey_screenshot)
 
         self.listener: Optional[keyboard.Listener] = None
         self.start_time: float = 0
 
-        # Hotkey detection state - support multi-character sequences
-        self.key_buffer: list[tuple[str, float]] = []  # (key, timestamp)
+        # Hotkey detection state - the last len(hotkey) keys and their timestamps
+        self.key_buffer: deque[str] = deque(maxlen=self._hotkey_len)
+        self.key_times: deque[float] = deque(maxlen=self._hotkey_len)
 
         # Debug counters
         self.total_keystrokes: int = 0
@@ -51,16 +55,22 @@ class KeyboardCapture:
 
         Returns the hotkey name if matched, None otherwise.
         """
-        # Clean old keys from buffer
-        self.key_buffer = [
-            (k, t) for k, t in self.key_buffer if current_time - t < self.hotkey_timeout
-        ]
+        # Keys are time-ordered, so stale ones can only sit at the left end
+        key_times = self.key_times
+        while key_times and current_time - key_times[0] >= self.hotkey_timeout:
+            key_times.popleft()
+            self.key_buffer.popleft()
 
-        # Check for screenshot hotkey match
-        if len(self.key_buffer) >= len(self.hotkey_screenshot):
-            recent_keys = "".join(k for k, t in self.key_buffer[-len(self.hotkey_screenshot) :])
-            if recent_keys == self.hotkey_screenshot:
-                return "screenshot"
+        # Buffer is bounded to the hotkey length, so it must be full to match
+        if not self._hotkey_len or len(self.key_buffer) < self._hotkey_len:
+            return None
+
+        # Cheapest mismatch first: the key just pressed must end the hotkey
+        if self.key_buffer[-1] != self._hotkey_tuple[-1]:
+            return None
+
+        if tuple(self.key_buffer) == self._hotkey_tuple:
+            return "screenshot"
 
         return None
 
@@ -78,7 +88,8 @@ class KeyboardCapture:
 
         # Add to buffer for hotkey detection (only non-special keys)
         if not is_special:
-            self.key_buffer.append((key_str, current_time))
+            self.key_buffer.append(key_str)
+            self.key_times.append(current_time)
 
             # Check for hotkey match
             matched_hotkey = self._check_hotkey(current_time)
@@ -89,6 +100,7 @@ class KeyboardCapture:
                 )
                 self.on_hotkey(matched_hotkey)
                 self.key_buffer.clear()  # Clear buffer after hotkey
+                self.key_times.clear()
                 return  # Don't log the hotkey keys
 
         # Report keystroke
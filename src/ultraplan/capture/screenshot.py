@@ -1,34 +1,98 @@
 """Screenshot capture using mss."""
 
+import queue
+import threading
 from pathlib import Path
+from typing import Optional
 
 import mss
 import mss.tools
 
 
 class ScreenshotCapture:
-    """Captures screenshots using mss (fast cross-platform)."""
+    """Captures screenshots using mss (fast cross-platform).
 
-    def __init__(self, output_dir: Path):
+    The screen grab happens in the caller, but PNG encoding (zlib over the
+    whole frame) runs on a background thread so capture() returns as soon as
+    the grab completes. Call close() to finish writing pending screenshots.
+
+    mss instances are not thread-safe, so each capturing thread keeps its own,
+    created on first use and reused for later captures.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        compression_level: int = 1,  # zlib level 0-9; 1 is several times faster than 6
+    ):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.compression_level = compression_level
+
+        # Pending (screenshot, filepath) pairs for the encoder thread; None stops it
+        self._encode_queue: queue.Queue[Optional[tuple]] = queue.Queue(maxsize=32)
+        self._encoder_thread: Optional[threading.Thread] = threading.Thread(
+            target=self._encode_loop, daemon=True
+        )
+        self._encoder_thread.start()
+
+        # Per-thread mss instances, plus a list of all of them for close()
+        self._local = threading.local()
+        self._instances: list[mss.base.MSSBase] = []
+        self._instances_lock = threading.Lock()
+
+    def _get_sct(self) -> mss.base.MSSBase:
+        """Get this thread's mss instance, creating it on first use."""
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+            with self._instances_lock:
+                self._instances.append(sct)
+        return sct
+
+    def _encode_loop(self):
+        """Encode grabbed frames to PNG files until close() is called."""
+        while True:
+            item = self._encode_queue.get()
+            if item is None:
+                break
+            sct_img, filepath = item
+            try:
+                mss.tools.to_png(
+                    sct_img.rgb, sct_img.size, level=self.compression_level, output=filepath
+                )
+            except Exception as e:
+                print(f"[screenshot] Failed to save {filepath}: {e}")
 
     def capture(self, timestamp_ms: int) -> str:
-        """Take screenshot and save to file.
+        """Take screenshot and queue it to be saved.
 
         Args:
             timestamp_ms: Milliseconds since session start.
 
         Returns:
-            Filename (not full path) of saved screenshot.
+            Filename (not full path) of the screenshot.
         """
         filename = f"img_{timestamp_ms:06d}.png"
         filepath = self.output_dir / filename
 
-        with mss.mss() as sct:
-            # Capture all monitors (monitor[0] is the combined virtual screen)
-            monitor = sct.monitors[0]
-            sct_img = sct.grab(monitor)
-            mss.tools.to_png(sct_img.rgb, sct_img.size, output=str(filepath))
+        sct = self._get_sct()
+        # Capture all monitors (monitor[0] is the combined virtual screen)
+        sct_img = sct.grab(sct.monitors[0])
 
+        self._encode_queue.put((sct_img, str(filepath)))
         return filename
+
+    def close(self):
+        """Wait for pending screenshots to be written and release resources."""
+        if self._encoder_thread:
+            self._encode_queue.put(None)
+            self._encoder_thread.join()
+            self._encoder_thread = None
+
+        with self._instances_lock:
+            for sct in self._instances:
+                sct.close()
+            self._instances.clear()
+        self._local = threading.local()
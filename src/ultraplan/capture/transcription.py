@@ -23,21 +23,37 @@ class TranscriptionWorker:
         self.vocabulary_boost = vocabulary_boost or []
 
         self.model = None
-        self.audio_buffer: list[np.ndarray] = []
-        self.buffer_samples = 0
+        # Batched pipeline over the same model, for long audio (second pass)
+        self.batched_model = None
         self.target_samples = int(sample_rate * buffer_duration)
+        # Preallocated mono buffer; chunks are copied in at the write cursor
+        # (buffer_samples) so transcription gets a contiguous view, not a concat.
+        self.audio_buffer = np.empty(self.target_samples * 2, dtype=np.float32)
+        self.buffer_samples = 0
+        self.buffer_peak = 0.0  # Max absolute amplitude of the buffered audio
 
         # Build initial prompt to bias Whisper toward our vocabulary
         self.initial_prompt = self._build_initial_prompt()
 
-    def _build_initial_prompt(self) -> str:
+        # Real-time transcription settings, built once and reused for every window
+        self._transcribe_kwargs = dict(
+            beam_size=1,  # Faster for real-time
+            language="en",
+            vad_filter=True,  # Filter silence
+            vad_parameters=dict(
+                min_silence_duration_ms=500,
+            ),
+            initial_prompt=self.initial_prompt,
+        )
+
+    def _build_initial_prompt(self) -> Optional[str]:
         """Build an initial prompt that biases Whisper toward our vocabulary.
 
         The initial_prompt tells Whisper what kind of words/style to expect,
         which significantly improves recognition of uncommon words.
         """
         if not self.vocabulary_boost:
-            return ""
+            return None
 
         # Create a prompt that includes the words naturally
         # Whisper works best when words appear in context
@@ -49,6 +65,12 @@ class TranscriptionWorker:
         """Load Whisper model - call once at startup."""
         from faster_whisper import WhisperModel
 
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            # faster-whisper < 1.1 has no batched pipeline
+            BatchedInferencePipeline = None
+
         # Determine device and compute type
         device = "cpu"
         compute_type = "int8"
@@ -58,7 +80,7 @@ class TranscriptionWorker:
 
             if torch.cuda.is_available():
                 device = "cuda"
-                compute_type = "float16"
+                compute_type = "int8_float16"  # int8 weights, fp16 activations
             # Note: faster-whisper doesn't support MPS yet, use CPU for Apple Silicon
         except ImportError:
             pass
@@ -68,14 +90,28 @@ class TranscriptionWorker:
             device=device,
             compute_type=compute_type,
         )
+        if BatchedInferencePipeline is not None:
+            self.batched_model = BatchedInferencePipeline(model=self.model)
 
     def add_audio(self, chunk: np.ndarray):
         """Add audio chunk to buffer.
 
         When buffer has enough audio, triggers transcription.
         """
-        self.audio_buffer.append(chunk)
-        self.buffer_samples += len(chunk)
+        samples = chunk.reshape(-1)
+        n = samples.size
+
+        # Make room if this chunk would overflow the buffer
+        if self.buffer_samples + n > self.audio_buffer.size:
+            self._transcribe_buffer()
+            if n > self.audio_buffer.size:
+                self.audio_buffer = np.empty(n, dtype=np.float32)
+
+        self.audio_buffer[self.buffer_samples : self.buffer_samples + n] = samples
+        self.buffer_samples += n
+        if n:
+            # max/-min instead of abs().max() so no temporary array is created
+            self.buffer_peak = max(self.buffer_peak, float(samples.max()), -float(samples.min()))
 
         # Check if we have enough audio to transcribe
         if self.buffer_samples >= self.target_samples:
@@ -83,39 +119,31 @@ class TranscriptionWorker:
 
     def flush(self):
         """Transcribe any remaining audio in buffer."""
-        if self.audio_buffer and self.buffer_samples > self.sample_rate * 0.5:
+        if self.buffer_samples > self.sample_rate * 0.5:
             # Only transcribe if at least 0.5 seconds of audio
             self._transcribe_buffer()
 
+    def _reset_buffer(self):
+        """Discard buffered audio."""
+        self.buffer_samples = 0
+        self.buffer_peak = 0.0
+
     def _transcribe_buffer(self):
         """Transcribe accumulated audio buffer."""
-        if not self.audio_buffer or self.model is None:
+        if not self.buffer_samples:
             return
 
-        # Concatenate audio chunks
-        audio = np.concatenate(self.audio_buffer, axis=0)
-        audio = audio.flatten().astype(np.float32)
-
-        # Clear buffer
-        self.audio_buffer = []
-        self.buffer_samples = 0
-
-        # Skip if audio is too quiet (likely silence)
-        if np.abs(audio).max() < 0.01:
+        # Skip if audio is too quiet (likely silence) - peak is tracked per chunk
+        if self.model is None or self.buffer_peak < 0.01:
+            self._reset_buffer()
             return
 
+        # View of the buffered audio (already float32 mono from sounddevice)
+        audio = self.audio_buffer[: self.buffer_samples]
+
         # Transcribe
         try:
-            segments, info = self.model.transcribe(
-                audio,
-                beam_size=1,  # Faster for real-time
-                language="en",
-                vad_filter=True,  # Filter silence
-                vad_parameters=dict(
-                    min_silence_duration_ms=500,
-                ),
-                initial_prompt=self.initial_prompt if self.initial_prompt else None,
-            )
+            segments, info = self.model.transcribe(audio, **self._transcribe_kwargs)
 
             # Collect segments
             text_parts = []
@@ -131,3 +159,6 @@ class TranscriptionWorker:
         except Exception as e:
             # Don't crash on transcription errors
             print(f"Transcription error: {e}")
+        finally:
+            # Segments are consumed above, so the buffer can be reused now
+            self._reset_buffer()
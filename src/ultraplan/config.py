@@ -25,6 +25,7 @@ class SessionConfig:
     audio_device: Optional[str] = None  # None = default/BlackHole
     hotkey_screenshot: str = "jj"
     hotkey_timeout: float = 0.5  # Max time between keys for hotkey detection
+    screenshot_compression: int = 1  # PNG zlib level (0-9); low levels encode much faster
     voice_trigger: str = "marco"  # Voice command to trigger screenshot
     voice_stop: str = "finito"  # Voice command to stop recording
     vocabulary_boost: list[str] = None  # Words to boost recognition for
@@ -32,6 +33,7 @@ class SessionConfig:
     enable_clipboard: bool = True
     save_audio: bool = True
     audio_buffer_duration: float = 3.0  # Seconds to buffer before transcribing
+    audio_ring_duration: float = 60.0  # Seconds of audio held while transcription catches up
     clipboard_poll_interval: float = 0.5
 
     def __post_init__(self):
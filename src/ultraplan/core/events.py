@@ -1,8 +1,8 @@
 """Event types for the recording timeline."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any
+from typing import Any, Optional
 
 
 class EventType(Enum):
@@ -16,108 +16,88 @@ class EventType(Enum):
     SCREENSHOT = "screenshot"
 
 
-@dataclass
+# Fields shared by every event; everything else is event-specific data
+_BASE_FIELDS = frozenset({"type", "timestamp_ms"})
+
+
+@dataclass(slots=True, init=False)
 class Event:
-    """Base event class for all recorded events."""
+    """Base event class for all recorded events.
+
+    Events use slots and store their payload as plain fields, so a session
+    with tens of thousands of keystrokes doesn't pay for a __dict__ and a
+    data dict per event. A plain Event still takes its payload as a data dict.
+    """
 
     type: EventType
     timestamp_ms: int  # Milliseconds since session start
-    data: dict[str, Any] = field(default_factory=dict)
-
-
-@dataclass
-class TranscriptEvent(Event):
-    """Event for transcribed audio segments."""
+    # Payload passed to a plain Event; None for the subclasses
+    _data: Optional[dict[str, Any]] = field(default=None, init=False, repr=False)
 
     def __init__(
         self,
+        type: EventType,
         timestamp_ms: int,
-        text: str,
-        confidence: float = 0.0,
-        is_partial: bool = False,
+        data: Optional[dict[str, Any]] = None,
     ):
-        super().__init__(
-            type=EventType.TRANSCRIPT,
-            timestamp_ms=timestamp_ms,
-            data={
-                "text": text,
-                "confidence": confidence,
-                "is_partial": is_partial,
-            },
-        )
+        self.type = type
+        self.timestamp_ms = timestamp_ms
+        self._data = {} if data is None else data
 
     @property
-    def text(self) -> str:
-        return self.data["text"]
+    def data(self) -> dict[str, Any]:
+        """Event-specific fields as a dict (built on each access for subclasses).
+
+        Derived fields (init=False) are left out.
+        """
+        if self._data is not None:
+            return self._data
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.init and f.name not in _BASE_FIELDS
+        }
 
 
-@dataclass
+@dataclass(slots=True)
+class TranscriptEvent(Event):
+    """Event for transcribed audio segments."""
+
+    type: EventType = field(default=EventType.TRANSCRIPT, init=False)
+    text: str
+    confidence: float = 0.0
+    is_partial: bool = False
+    # Counted once here so output generators don't re-split the text
+    word_count: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.word_count = len(self.text.split())
+        # Whisper can report a numpy scalar, which orjson refuses to serialize
+        self.confidence = float(self.confidence)
+
+
+@dataclass(slots=True)
 class KeystrokeEvent(Event):
     """Event for a single keystroke."""
 
-    def __init__(
-        self,
-        timestamp_ms: int,
-        key: str,
-        is_special: bool = False,
-    ):
-        super().__init__(
-            type=EventType.KEYSTROKE,
-            timestamp_ms=timestamp_ms,
-            data={
-                "key": key,
-                "is_special": is_special,
-            },
-        )
-
-    @property
-    def key(self) -> str:
-        return self.data["key"]
+    type: EventType = field(default=EventType.KEYSTROKE, init=False)
+    key: str
+    is_special: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipboardEvent(Event):
     """Event for clipboard content changes."""
 
-    def __init__(
-        self,
-        timestamp_ms: int,
-        content: str,
-        content_type: str = "text",
-    ):
-        super().__init__(
-            type=EventType.CLIPBOARD,
-            timestamp_ms=timestamp_ms,
-            data={
-                "content": content,
-                "content_type": content_type,
-            },
-        )
-
-    @property
-    def content(self) -> str:
-        return self.data["content"]
+    type: EventType = field(default=EventType.CLIPBOARD, init=False)
+    content: str
+    content_type: str = "text"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenshotEvent(Event):
     """Event for a captured screenshot."""
 
-    def __init__(
-        self,
-        timestamp_ms: int,
-        filename: str,
-        trigger: str = "hotkey",
-    ):
-        super().__init__(
-            type=EventType.SCREENSHOT,
-            timestamp_ms=timestamp_ms,
-            data={
-                "filename": filename,
-                "trigger": trigger,
-            },
-        )
-
-    @property
-    def filename(self) -> str:
-        return self.data["filename"]
+    type: EventType = field(default=EventType.SCREENSHOT, init=False)
+    filename: str
+    trigger: str = "hotkey"
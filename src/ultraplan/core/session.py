@@ -1,8 +1,12 @@
 """Main recording session orchestrator."""
 
-import queue
+import functools
+import os
+import re
 import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +16,14 @@ from rich.live import Live
 from rich.panel import Panel
 from scipy.io import wavfile
 
+try:
+    # Optional C implementation (pip install ultraplan[fast]); see _sounds_like
+    from rapidfuzz import process as rapidfuzz_process
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    rapidfuzz_process = None
+    Levenshtein = None
+
 from ultraplan.capture.audio import AudioCapture
 from ultraplan.capture.clipboard import ClipboardMonitor
 from ultraplan.capture.keyboard import KeyboardCapture
@@ -33,6 +45,73 @@ from ultraplan.output.markdown import MarkdownOutputGenerator
 console = Console()
 
 
+@functools.lru_cache(maxsize=4096)
+def _edit_distance(s1: str, s2: str, max_distance: int) -> int:
+    """Compute Levenshtein edit distance between two strings.
+
+    Only cells within max_distance of the diagonal are computed (any path
+    outside that band already costs more), and the search gives up as soon as
+    the distance is known to exceed max_distance, returning max_distance + 1.
+    Cached, since voice-command checks see the same short words over and over.
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    n, m = len(s1), len(s2)
+    too_far = max_distance + 1
+    if n - m > max_distance:
+        return too_far
+    if m == 0:
+        return n
+
+    prev_row = [j if j <= max_distance else too_far for j in range(m + 1)]
+    for i in range(1, n + 1):
+        c1 = s1[i - 1]
+        curr_row = [too_far] * (m + 1)
+        if i <= max_distance:
+            curr_row[0] = i
+        row_min = curr_row[0]
+        for j in range(max(1, i - max_distance), min(m, i + max_distance) + 1):
+            cost = min(
+                prev_row[j] + 1,  # insertion
+                curr_row[j - 1] + 1,  # deletion
+                prev_row[j - 1] + (c1 != s2[j - 1]),  # substitution
+            )
+            if cost > too_far:
+                cost = too_far
+            curr_row[j] = cost
+            if cost < row_min:
+                row_min = cost
+        # Row minimums never decrease, so the final distance is already too big
+        if row_min > max_distance:
+            return too_far
+        prev_row = curr_row
+
+    return prev_row[m]
+
+
+# Punctuation ignored when comparing transcript words to voice commands
+_PUNCT_CHARS = ".,!?;:'\""
+_PUNCT_TABLE = str.maketrans("", "", _PUNCT_CHARS)
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write data to path with raw os calls (normally on the I/O pool)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _log_io_error(future: Future) -> None:
+    """Report an exception raised by a task on the I/O pool."""
+    exc = future.exception()
+    if exc is not None:
+        console.print(f"[yellow]Background task failed: {exc}[/yellow]")
+
+
 def _sounds_like(text: str, target: str, threshold: int = 2) -> bool:
     """Check if any word in text sounds similar to target using edit distance.
 
@@ -47,35 +126,19 @@ def _sounds_like(text: str, target: str, threshold: int = 2) -> bool:
     Returns:
         True if any word in text is within threshold edits of target
     """
-
-    def edit_distance(s1: str, s2: str) -> int:
-        """Compute Levenshtein edit distance between two strings."""
-        if len(s1) < len(s2):
-            s1, s2 = s2, s1
-        if len(s2) == 0:
-            return len(s1)
-
-        prev_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            curr_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = prev_row[j + 1] + 1
-                deletions = curr_row[j] + 1
-                substitutions = prev_row[j] + (c1 != c2)
-                curr_row.append(min(insertions, deletions, substitutions))
-            prev_row = curr_row
-
-        return prev_row[-1]
-
     target_lower = target.lower()
-    # Check each word in the text
-    for word in text.lower().split():
-        # Strip punctuation
-        word = word.strip(".,!?;:'\"")
+    target_len = len(target_lower)
+    # Drop punctuation from the whole text in one C pass, then check each word
+    for word in text.lower().translate(_PUNCT_TABLE).split():
         # Skip words that are very different in length
-        if abs(len(word) - len(target_lower)) > threshold:
+        if abs(len(word) - target_len) > threshold:
             continue
-        if edit_distance(word, target_lower) <= threshold:
+        if Levenshtein is not None:
+            # score_cutoff lets RapidFuzz stop as soon as threshold is exceeded
+            distance = Levenshtein.distance(word, target_lower, score_cutoff=threshold)
+        else:
+            distance = _edit_distance(word, target_lower, threshold)
+        if distance <= threshold:
             return True
     return False
 
@@ -86,7 +149,11 @@ class RecordingSession:
     def __init__(self, config: SessionConfig):
         self.config = config
         self.timeline = Timeline()
-        self.event_queue: queue.Queue[Event] = queue.Queue()
+        # Pending events for the consumer thread. deque.append/popleft are
+        # atomic, so producers never take a lock; _event_signal wakes the
+        # consumer when something was added.
+        self._events: deque[Event] = deque()
+        self._event_signal = threading.Event()
         self.running = threading.Event()
 
         # Capture modules
@@ -100,18 +167,40 @@ class RecordingSession:
         self.consumer_thread: Optional[threading.Thread] = None
         self.audio_thread: Optional[threading.Thread] = None
         self.display_thread: Optional[threading.Thread] = None
+        # Slow side effects (screen grabs, file writes) triggered from capture callbacks
+        self._io_pool: Optional[ThreadPoolExecutor] = None
 
         # State
         self.session_dir: Optional[Path] = None
-        self.audio_chunks: list[np.ndarray] = []
+        # Recorded mono audio; only the first _audio_len samples are valid
+        self._audio_buf: np.ndarray = np.empty(0, dtype=np.float32)
+        self._audio_len: int = 0
         self.transcript_lines: list[str] = []  # Real-time transcript chunks
+        self._recent_transcript: deque[str] = deque(maxlen=8)  # Last lines, for the display
         self.full_transcript: str = ""  # Full second-pass transcript
         self.screenshots: list[str] = []  # List of screenshot filenames
         self.last_screenshot_time: float = 0  # For display flash effect
         self.last_screenshot_trigger: str = ""  # What triggered the screenshot
         self.clipboard_count: int = 0
         self.last_clipboard_time: float = 0
-        self._voice_stop_requested: bool = False  # Voice command to stop
+        self._voice_stop = threading.Event()  # Set by the voice stop command
+        self._display_dirty = threading.Event()  # Set when the live display needs a redraw
+
+        # Voice command matchers, prepared once instead of per transcript
+        self._voice_trigger_lc = (config.voice_trigger or "").lower()
+        self._voice_stop_lc = (config.voice_stop or "").lower()
+        self._voice_stop_re = re.compile(rf"\b{re.escape(self._voice_stop_lc)}\b")
+        self._voice_command_words = [
+            w.lower() for w in (config.voice_trigger, config.voice_stop) if w
+        ]
+        # Any command word with optional trailing punctuation/whitespace, longest first
+        self._voice_command_re = re.compile(
+            "|".join(
+                rf"\b{re.escape(word)}\b[,.\s]*"
+                for word in sorted(self._voice_command_words, key=len, reverse=True)
+            ),
+            re.IGNORECASE,
+        )
 
     def _setup_session_dir(self) -> Path:
         """Create the session output directory."""
@@ -128,19 +217,29 @@ class RecordingSession:
             confidence=confidence,
             is_partial=is_partial,
         )
-        self.event_queue.put(event)
+        self._emit(event)
         if not is_partial:
             self.transcript_lines.append(text)
+            self._recent_transcript.append(text)
+            self._display_dirty.set()
+
+            text_lc = text.lower()
 
             # Check for voice trigger word (screenshot)
-            trigger_word = self.config.voice_trigger.lower()
-            if trigger_word and trigger_word in text.lower():
-                self._capture_screenshot(trigger=f"voice:{trigger_word}")
-
-            # Check for voice stop command (with fuzzy matching for Whisper mistranscriptions)
-            stop_phrase = self.config.voice_stop
-            if stop_phrase and _sounds_like(text, stop_phrase):
-                self._voice_stop_requested = True
+            trigger_word = self._voice_trigger_lc
+            if trigger_word and trigger_word in text_lc:
+                # Grab on the I/O pool so transcription isn't held up
+                self._submit_io(self._capture_screenshot, f"voice:{trigger_word}")
+
+            # Check for voice stop command. An exact match is found with a cheap
+            # substring test (confirmed on word boundaries); only otherwise fall
+            # back to fuzzy matching for Whisper mistranscriptions.
+            stop_phrase = self._voice_stop_lc
+            if stop_phrase and (
+                (stop_phrase in text_lc and self._voice_stop_re.search(text_lc))
+                or _sounds_like(text_lc, stop_phrase)
+            ):
+                self._voice_stop.set()
                 from ultraplan.platform.macos import play_sound
 
                 play_sound("Purr")  # Acknowledgment sound
@@ -152,7 +251,7 @@ class RecordingSession:
             key=key,
             is_special=is_special,
         )
-        self.event_queue.put(event)
+        self._emit(event)
 
     def _capture_screenshot(self, trigger: str = "manual") -> Optional[str]:
         """Capture a screenshot and record the event.
@@ -173,12 +272,13 @@ class RecordingSession:
             filename=filename,
             trigger=trigger,
         )
-        self.event_queue.put(event)
+        self._emit(event)
 
         # Track screenshot for display
         self.screenshots.append(filename)
         self.last_screenshot_time = time.time()
         self.last_screenshot_trigger = trigger
+        self._display_dirty.set()
 
         # Play sound notification
         from ultraplan.platform.macos import notify_screenshot_taken
@@ -198,21 +298,34 @@ class RecordingSession:
             timestamp_ms=timestamp_ms,
             content=content,
         )
-        self.event_queue.put(event)
+        self._emit(event)
 
         # Track for display
         self.clipboard_count += 1
         self.last_clipboard_time = time.time()
+        self._display_dirty.set()
 
     def _on_clipboard_image(self, image_data: bytes, timestamp_ms: int):
         """Callback for clipboard image changes (e.g., Cmd+Ctrl+Shift+4 screenshots)."""
         if not self.session_dir:
             return
 
-        # Save image to session directory
+        # Save off the clipboard polling thread, or right here if the pool has
+        # already been shut down
+        if not self._submit_io(self._save_clipboard_image, image_data, timestamp_ms):
+            try:
+                self._save_clipboard_image(image_data, timestamp_ms)
+            except OSError as e:
+                console.print(f"[yellow]Failed to save clipboard image: {e}[/yellow]")
+
+    def _save_clipboard_image(self, image_data: bytes, timestamp_ms: int):
+        """Write a clipboard image to the session directory and record it.
+
+        The event is only emitted once the file has been written, so the
+        outputs never link to a missing image.
+        """
         filename = f"clip_{timestamp_ms:06d}.png"
-        filepath = self.session_dir / filename
-        filepath.write_bytes(image_data)
+        _write_file(str(self.session_dir / filename), image_data)
 
         # Create screenshot event
         event = ScreenshotEvent(
@@ -220,26 +333,86 @@ class RecordingSession:
             filename=filename,
             trigger="clipboard",
         )
-        self.event_queue.put(event)
+        self._emit(event)
 
         # Track for display
         self.screenshots.append(filename)
         self.last_screenshot_time = time.time()
         self.last_screenshot_trigger = "clipboard"
+        self._display_dirty.set()
 
-        # Notify user
+        # Notify user (the sound plays in the background)
         from ultraplan.platform.macos import notify_screenshot_taken
 
         notify_screenshot_taken(filename)
 
+    def _submit_io(self, fn, *args) -> bool:
+        """Run fn(*args) on the I/O pool, reporting any exception it raises.
+
+        Capture callbacks can still fire while stop() is shutting down; once
+        the pool is gone, the work is not accepted.
+
+        Returns:
+            True if the work was queued, False if the pool is gone.
+        """
+        pool = self._io_pool
+        if pool is None:
+            return False
+        try:
+            future = pool.submit(fn, *args)
+        except RuntimeError:
+            return False  # Shut down between the check and the submit
+        future.add_done_callback(_log_io_error)
+        return True
+
+    def _emit(self, event: Event):
+        """Hand an event to the consumer thread (safe from any thread)."""
+        self._events.append(event)
+        # Skip the Event's internal lock when a wakeup is already pending
+        if not self._event_signal.is_set():
+            self._event_signal.set()
+
     def _consume_events(self):
         """Consumer thread that collects events into timeline."""
-        while self.running.is_set() or not self.event_queue.empty():
-            try:
-                event = self.event_queue.get(timeout=0.1)
-                self.timeline.add_event(event)
-            except queue.Empty:
+        events = self._events
+        while self.running.is_set() or events:
+            if not self._event_signal.wait(timeout=0.1):
                 continue
+            # Clear before draining: anything appended after this point sets
+            # the signal again, so it's picked up on the next pass
+            self._event_signal.clear()
+            # Drain everything queued so a burst of keystrokes costs one wakeup
+            batch = []
+            try:
+                while True:
+                    batch.append(events.popleft())
+            except IndexError:
+                pass
+            self.timeline.add_events(batch)
+
+    def _append_audio(self, chunk: np.ndarray):
+        """Copy a mono audio chunk onto the end of the recording buffer.
+
+        The buffer doubles when full, so appends are amortized O(chunk) and the
+        recording never has to be concatenated from pieces.
+        """
+        samples = chunk.reshape(-1)
+        end = self._audio_len + samples.size
+        if end > self._audio_buf.size:
+            grown = np.empty(max(end, self._audio_buf.size * 2), dtype=np.float32)
+            grown[: self._audio_len] = self._audio_buf[: self._audio_len]
+            self._audio_buf = grown
+        self._audio_buf[self._audio_len : end] = samples
+        self._audio_len = end
+
+    @property
+    def recorded_audio(self) -> np.ndarray:
+        """View of all audio recorded so far (float32 mono).
+
+        The view is 1-D and C-contiguous, so it can be handed to Whisper or
+        scipy without a copy. It's only valid until the next append.
+        """
+        return self._audio_buf[: self._audio_len]
 
     def _audio_loop(self):
         """Audio capture and transcription loop."""
@@ -247,11 +420,13 @@ class RecordingSession:
             return
 
         while self.running.is_set():
+            # The chunk is only valid until the next get_chunk(); both consumers
+            # below copy it into their own buffers
             chunk = self.audio_capture.get_chunk(timeout=0.5)
             if chunk is not None:
                 # Store raw audio for WAV file
                 if self.config.save_audio:
-                    self.audio_chunks.append(chunk.copy())
+                    self._append_audio(chunk)
                 # Feed to transcription worker
                 self.transcription_worker.add_audio(chunk)
 
@@ -266,8 +441,8 @@ class RecordingSession:
             mins, secs = divmod(duration_s, 60)
 
             transcript_text = (
-                "\n".join(self.transcript_lines[-8:])
-                if self.transcript_lines
+                "\n".join(self._recent_transcript)
+                if self._recent_transcript
                 else "[dim](waiting for speech...)[/dim]"
             )
 
@@ -310,27 +485,46 @@ class RecordingSession:
 
             return Panel(content, title="ultraplan", border_style="blue")
 
-        with Live(render_panel(), refresh_per_second=4, console=console) as live:
+        # Redraw only when state changed, plus once a second to tick the clock
+        # and expire the 2-second flashes; bursts are coalesced to 4 redraws/s
+        min_interval = 0.25
+        with Live(render_panel(), console=console, auto_refresh=False) as live:
+            last_render = time.monotonic()
             while self.running.is_set():
-                live.update(render_panel())
-                time.sleep(0.25)
+                self._display_dirty.wait(timeout=1.0)
+                if not self.running.is_set():
+                    break
+                delay = last_render + min_interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                self._display_dirty.clear()
+                live.update(render_panel(), refresh=True)
+                last_render = time.monotonic()
 
     def start(self):
         """Start the recording session."""
         self.timeline.start()
         self.session_dir = self._setup_session_dir()
         self.running.set()
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ultraplan-io")
 
         # Add session start event
-        self.event_queue.put(Event(type=EventType.SESSION_START, timestamp_ms=0, data={}))
+        self._emit(Event(type=EventType.SESSION_START, timestamp_ms=0))
 
         # Initialize capture modules
-        self.screenshot_capture = ScreenshotCapture(self.session_dir)
+        self.screenshot_capture = ScreenshotCapture(
+            self.session_dir,
+            compression_level=self.config.screenshot_compression,
+        )
 
-        # Audio and transcription
+        # Audio and transcription (start with room for a minute of recording)
+        if self.config.save_audio:
+            self._audio_buf = np.empty(self.config.sample_rate * 60, dtype=np.float32)
+            self._audio_len = 0
         self.audio_capture = AudioCapture(
             device=self.config.audio_device,
             sample_rate=self.config.sample_rate,
+            ring_duration=self.config.audio_ring_duration,
         )
 
         # Build vocabulary boost list (voice commands + custom words)
@@ -390,26 +584,26 @@ class RecordingSession:
         Returns:
             "keyboard" if stopped by Ctrl+C, "voice" if stopped by voice command.
         """
+        if not self.running.is_set():
+            return "unknown"
         try:
-            while self.running.is_set():
-                if self._voice_stop_requested:
-                    return "voice"
-                time.sleep(0.1)
+            # Blocks without polling; Ctrl+C still interrupts the wait
+            self._voice_stop.wait()
+            return "voice"
         except KeyboardInterrupt:
             return "keyboard"
-        return "unknown"
 
     def stop(self):
         """Stop the recording session and generate outputs."""
         self.running.clear()
+        self._display_dirty.set()  # Wake the display loop so it exits promptly
         self.timeline.stop()
 
         # Add session end event
-        self.event_queue.put(
+        self._emit(
             Event(
                 type=EventType.SESSION_END,
                 timestamp_ms=self.timeline.get_timestamp_ms(),
-                data={},
             )
         )
 
@@ -431,15 +625,35 @@ class RecordingSession:
         if self.audio_thread:
             self.audio_thread.join(timeout=2.0)
 
+        if self.audio_capture and self.audio_capture.dropped_frames:
+            dropped_s = self.audio_capture.dropped_frames / self.config.sample_rate
+            console.print(
+                f"[yellow]⚠ {dropped_s:.1f}s of audio was dropped because transcription "
+                "fell behind. Try a smaller --model.[/yellow]"
+            )
+
+        # Let queued screenshots and file writes finish
+        if self._io_pool:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+
         if self.consumer_thread:
             self.consumer_thread.join(timeout=2.0)
 
+        # Pick up anything emitted after the consumer thread ran dry
+        if self._events and not (self.consumer_thread and self.consumer_thread.is_alive()):
+            self.timeline.add_events([self._events.popleft() for _ in range(len(self._events))])
+
+        # Finish writing screenshots still being encoded
+        if self.screenshot_capture:
+            self.screenshot_capture.close()
+
         # Save raw audio
-        if self.config.save_audio and self.audio_chunks and self.session_dir:
+        if self.config.save_audio and self._audio_len and self.session_dir:
             self._save_audio()
 
         # Run second-pass transcription on full audio for better quality
-        if self.config.save_audio and self.audio_chunks and self.session_dir:
+        if self.config.save_audio and self._audio_len and self.session_dir:
             self._run_full_transcription()
 
         # Generate outputs
@@ -448,12 +662,15 @@ class RecordingSession:
 
     def _save_audio(self):
         """Save recorded audio as WAV file."""
-        if not self.audio_chunks:
+        if not self._audio_len:
             return
 
         audio_path = self.session_dir / "audio.wav"
-        audio_data = np.concatenate(self.audio_chunks, axis=0)
-        audio_data = (audio_data * 32767).astype(np.int16)
+        # Scale straight into the int16 output; numpy casts in small blocks, so
+        # no full-size float temporary is allocated. recorded_audio is left
+        # untouched because the second-pass transcription still reads it.
+        audio_data = np.empty(self._audio_len, dtype=np.int16)
+        np.multiply(self.recorded_audio, 32767, out=audio_data, casting="unsafe")
         wavfile.write(str(audio_path), self.config.sample_rate, audio_data)
         console.print(f"[dim]Audio saved: {audio_path}[/dim]")
 
@@ -469,32 +686,26 @@ class RecordingSession:
         console.print("[dim]Running full transcription (second pass)...[/dim]")
 
         try:
-            # Concatenate all audio
-            audio = np.concatenate(self.audio_chunks, axis=0)
-            audio = audio.flatten().astype(np.float32)
+            # Contiguous float32 view of the recording; nothing is copied
+            audio = self.recorded_audio
 
             # Skip if audio is too short or too quiet
             if len(audio) < self.config.sample_rate:  # Less than 1 second
                 return
-            if np.abs(audio).max() < 0.01:
+            # Peak amplitude from two reductions; avoids a full-size abs() temporary
+            if max(audio.max(), -audio.min()) < 0.01:
                 return
 
-            # Build vocabulary boost prompt
-            vocab_boost = []
-            if self.config.voice_trigger:
-                vocab_boost.append(self.config.voice_trigger)
-            if self.config.voice_stop:
-                vocab_boost.extend(self.config.voice_stop.split())
-            if self.config.vocabulary_boost:
-                vocab_boost.extend(self.config.vocabulary_boost)
-
-            initial_prompt = ""
-            if vocab_boost:
-                words = ", ".join(vocab_boost)
-                initial_prompt = f"Voice commands include: {words}. "
+            # Batch the VAD-split speech segments through the model when the
+            # batched pipeline is available; otherwise decode sequentially
+            worker = self.transcription_worker
+            if worker.batched_model is not None:
+                transcribe = functools.partial(worker.batched_model.transcribe, batch_size=8)
+            else:
+                transcribe = worker.model.transcribe
 
             # Run transcription with higher quality settings
-            segments, info = self.transcription_worker.model.transcribe(
+            segments, info = transcribe(
                 audio,
                 beam_size=5,  # Higher beam size for better accuracy (vs 1 for real-time)
                 language="en",
@@ -502,7 +713,8 @@ class RecordingSession:
                 vad_parameters=dict(
                     min_silence_duration_ms=300,  # More sensitive than real-time
                 ),
-                initial_prompt=initial_prompt if initial_prompt else None,
+                # Same vocabulary boost prompt as the real-time pass
+                initial_prompt=worker.initial_prompt,
                 word_timestamps=True,  # Get word-level timestamps
             )
 
@@ -530,42 +742,35 @@ class RecordingSession:
         Filters out the voice trigger word (e.g., "marco") and stop word (e.g., "finito")
         including common Whisper mistranscriptions using fuzzy matching.
         """
-        import re
-
-        words_to_remove = []
-
-        # Add voice trigger word and variations
-        if self.config.voice_trigger:
-            words_to_remove.append(self.config.voice_trigger)
-
-        # Add voice stop word and variations
-        if self.config.voice_stop:
-            words_to_remove.append(self.config.voice_stop)
-
-        if not words_to_remove:
+        if not self._voice_command_words:
             return text
 
-        # Build pattern for each word (case-insensitive, with optional punctuation)
-        filtered = text
-        for word in words_to_remove:
-            # Match the word with optional surrounding punctuation/whitespace
-            # Also match common mistranscriptions (within edit distance 2)
-            pattern = rf"\b{re.escape(word)}\b[,.\s]*"
-            filtered = re.sub(pattern, "", filtered, flags=re.IGNORECASE)
-
-            # Also try to match fuzzy variations by checking each word
-            result_words = []
-            for w in filtered.split():
-                clean_w = w.strip(".,!?;:'\"")
-                if _sounds_like(clean_w, word, threshold=2):
-                    # Skip this word (it's a voice command)
-                    continue
-                result_words.append(w)
-            filtered = " ".join(result_words)
-
-        # Clean up extra whitespace
-        filtered = re.sub(r"\s+", " ", filtered).strip()
-        return filtered
+        # Remove exact matches of every command word in one sweep (this also
+        # handles multi-word phrases, which the token pass below can't)
+        tokens = self._voice_command_re.sub("", text).split()
+        if not tokens:
+            return ""
+
+        # Then drop tokens that sound like any command word, in a single pass
+        targets = self._voice_command_words
+        cleaned = [t.strip(_PUNCT_CHARS).lower() for t in tokens]
+        if Levenshtein is not None:
+            # One C call for the whole tokens x targets distance matrix
+            distances = rapidfuzz_process.cdist(
+                cleaned, targets, scorer=Levenshtein.distance, score_cutoff=2
+            )
+            keep = (distances > 2).all(axis=1)
+        else:
+            keep = [
+                all(
+                    abs(len(word) - len(target)) > 2 or _edit_distance(word, target, 2) > 2
+                    for target in targets
+                )
+                for word in cleaned
+            ]
+
+        # Joining the tokens also collapses extra whitespace
+        return " ".join(t for t, k in zip(tokens, keep) if k)
 
     def _generate_outputs(self):
         """Generate markdown and JSON output files."""
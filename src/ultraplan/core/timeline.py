@@ -1,11 +1,18 @@
 """Timeline management for recording sessions."""
 
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
-from ultraplan.core.events import Event
+import numpy as np
+
+from ultraplan.core.events import Event, EventType
+
+# Small integer code per event type, for the timeline's type array
+_TYPE_CODES = {event_type: code for code, event_type in enumerate(EventType)}
+_KEYSTROKE_CODE = _TYPE_CODES[EventType.KEYSTROKE]
 
 
 @dataclass
@@ -16,11 +23,98 @@ class Timeline:
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
     start_time: float = 0.0  # time.time() when session started
+    # time.monotonic_ns() at start
+    _start_ns: int = field(default=0, init=False, repr=False, compare=False)
     events: list[Event] = field(default_factory=list)
+    # Side indexes over self.events are kept up to date by add_event() and
+    # add_events(). If the list is changed directly, they're rebuilt the next
+    # time they're used (see _sync_index).
+
+    # Events grouped by type
+    _by_type: defaultdict[EventType, list[Event]] = field(
+        default_factory=lambda: defaultdict(list), init=False, repr=False, compare=False
+    )
+
+    # False once an event arrives with an earlier timestamp than the one before it
+    _is_sorted: bool = field(default=True, init=False, repr=False, compare=False)
+
+    # Timestamps and type codes of self.events, in the same order, for
+    # vectorized sorting and scans. Only the first len(self.events) entries
+    # are used; the buffers double in size when full.
+    _ts: np.ndarray = field(
+        default_factory=lambda: np.empty(64, dtype=np.int64),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _types: np.ndarray = field(
+        default_factory=lambda: np.empty(64, dtype=np.uint8),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    # The list and length the side indexes were built for
+    _indexed_list: Optional[list[Event]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_len: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Build the side indexes from scratch for self.events."""
+        events = self.events
+        n = len(events)
+        by_type = defaultdict(list)
+        for event in events:
+            by_type[event.type].append(event)
+        self._by_type = by_type
+        capacity = 64
+        while capacity < n:
+            capacity *= 2
+        self._ts = np.empty(capacity, dtype=np.int64)
+        self._ts[:n] = [e.timestamp_ms for e in events]
+        self._types = np.empty(capacity, dtype=np.uint8)
+        self._types[:n] = [_TYPE_CODES[e.type] for e in events]
+        self._is_sorted = self._check_sorted(events, 0)
+        self._indexed_list = events
+        self._indexed_len = n
+
+    def _sync_index(self) -> None:
+        """Rebuild the side indexes if self.events was replaced or resized directly."""
+        if self._indexed_list is not self.events or self._indexed_len != len(self.events):
+            self._rebuild_index()
+
+    def _reserve(self, size: int) -> None:
+        """Grow the timestamp and type buffers to hold at least size events."""
+        capacity = len(self._ts)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        n = self._indexed_len
+        ts = np.empty(capacity, dtype=np.int64)
+        ts[:n] = self._ts[:n]
+        types = np.empty(capacity, dtype=np.uint8)
+        types[:n] = self._types[:n]
+        self._ts = ts
+        self._types = types
+
+    @staticmethod
+    def _check_sorted(events: list[Event], last_ts: int) -> bool:
+        """Check that events are in timestamp order, starting after last_ts."""
+        for event in events:
+            if event.timestamp_ms < last_ts:
+                return False
+            last_ts = event.timestamp_ms
+        return True
 
     def start(self) -> None:
         """Start the timeline."""
         self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         self.started_at = datetime.now()
         self.session_id = self.started_at.strftime("session_%Y%m%d_%H%M%S")
 
@@ -30,11 +124,38 @@ class Timeline:
 
     def get_timestamp_ms(self) -> int:
         """Get current timestamp in milliseconds since session start."""
-        return int((time.time() - self.start_time) * 1000)
+        # Monotonic integer clock: no float math, and immune to wall-clock jumps
+        return (time.monotonic_ns() - self._start_ns) // 1_000_000
 
     def add_event(self, event: Event) -> None:
         """Add an event to the timeline."""
+        self._sync_index()
+        n = len(self.events)
+        if n and event.timestamp_ms < self.events[-1].timestamp_ms:
+            self._is_sorted = False
+        self._reserve(n + 1)
+        self._ts[n] = event.timestamp_ms
+        self._types[n] = _TYPE_CODES[event.type]
         self.events.append(event)
+        self._by_type[event.type].append(event)
+        self._indexed_len = n + 1
+
+    def add_events(self, events: list[Event]) -> None:
+        """Add several events to the timeline, in order."""
+        self._sync_index()
+        if self._is_sorted:
+            last_ts = self.events[-1].timestamp_ms if self.events else 0
+            self._is_sorted = self._check_sorted(events, last_ts)
+        n = len(self.events)
+        end = n + len(events)
+        self._reserve(end)
+        self._ts[n:end] = [e.timestamp_ms for e in events]
+        self._types[n:end] = [_TYPE_CODES[e.type] for e in events]
+        self.events.extend(events)
+        by_type = self._by_type
+        for event in events:
+            by_type[event.type].append(event)
+        self._indexed_len = end
 
     @property
     def duration_ms(self) -> int:
@@ -45,6 +166,52 @@ class Timeline:
             return self.get_timestamp_ms()
         return 0
 
+    def sorted_events(self) -> list[Event]:
+        """Get all events in timestamp order.
+
+        Events normally arrive in order, so this is usually free; otherwise
+        the timeline is sorted once by argsort of its timestamp array (stably,
+        so events with equal timestamps keep their arrival order). Returns the
+        timeline's own list; don't modify it.
+        """
+        self._sync_index()
+        if not self._is_sorted:
+            n = len(self.events)
+            order = np.argsort(self._ts[:n], kind="stable")
+            events = self.events
+            events[:] = [events[i] for i in order.tolist()]
+            self._ts[:n] = self._ts[:n][order]
+            self._types[:n] = self._types[:n][order]
+            self._is_sorted = True
+        return self.events
+
+    def keystroke_sequences(self, window_ms: int = 2000) -> list[tuple[int, list[Event]]]:
+        """Group keystrokes into sequences, in timestamp order.
+
+        A sequence starts at a keystroke and takes every later keystroke
+        within window_ms of that first one. Returns (start_ms, keystrokes)
+        pairs.
+        """
+        events = self.sorted_events()
+        n = len(events)
+        idx = np.flatnonzero(self._types[:n] == _KEYSTROKE_CODE)
+        ks_ts = self._ts[:n][idx]
+        # Each sequence ends at the first keystroke past its window, found by
+        # binary search, so the Python loop runs once per sequence, not per key
+        idx = idx.tolist()
+        sequences = []
+        i = 0
+        while i < len(idx):
+            start_ms = int(ks_ts[i])
+            j = int(np.searchsorted(ks_ts, start_ms + window_ms, side="right"))
+            sequences.append((start_ms, [events[k] for k in idx[i:j]]))
+            i = j
+        return sequences
+
     def get_events_by_type(self, event_type) -> list[Event]:
-        """Get all events of a specific type."""
-        return [e for e in self.events if e.type == event_type]
+        """Get all events of a specific type, in insertion order.
+
+        The returned list is the timeline's own index; don't modify it.
+        """
+        self._sync_index()
+        return self._by_type.get(event_type, [])
@@ -1,14 +1,37 @@
 """JSON output generator."""
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    # Optional Rust serializer (pip install ultraplan[fast]); see _dumps
+    import orjson
+except ImportError:
+    orjson = None
 
 from ultraplan.config import SessionConfig
 from ultraplan.core.events import EventType
 from ultraplan.core.timeline import Timeline
 
 
+def _dumps(obj: Any, level: int) -> bytes:
+    """Serialize obj as UTF-8, indent=2 JSON nested `level` levels deep.
+
+    Newlines only appear between tokens (they're escaped inside strings), so
+    re-indenting them gives the layout json.dump produces for the whole
+    document. Uses orjson when installed; its indented layout is the same, but
+    some floats are spelled differently (0.00001 rather than 1e-05), so the
+    output is equivalent JSON rather than identical bytes.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return data.replace(b"\n", b"\n" + b"  " * level)
+
+
 class JSONOutputGenerator:
     """Generates machine-parseable JSON output from a recording session."""
 
@@ -22,125 +45,136 @@ class JSONOutputGenerator:
         self.config = config
         self.full_transcript = full_transcript or ""
 
-    def _reconstruct_keystroke_sequences(self, events: list) -> list[dict]:
-        """Reconstruct keystroke sequences from individual events.
+    @staticmethod
+    def _keystroke_sequence(start_ms: int, keys: list[str]) -> dict:
+        """Build the JSON entry for one keystroke sequence.
 
-        Groups keystrokes that occur within 2 seconds of each other.
+        Takes ownership of keys (no copy).
         """
-        keystroke_events = [e for e in events if e.type == EventType.KEYSTROKE]
-        if not keystroke_events:
-            return []
-
-        sequences = []
-        current_keys = []
-        current_start = keystroke_events[0].timestamp_ms
-
-        for event in keystroke_events:
-            key = event.data["key"]
-
-            # Start new sequence if gap > 2 seconds
-            if current_keys and (event.timestamp_ms - current_start > 2000):
-                # Save current sequence
-                sequences.append(
-                    {
-                        "type": "keystroke_sequence",
-                        "timestamp_ms": current_start,
-                        "data": {
-                            "keys": current_keys.copy(),
-                            "reconstructed": "".join(current_keys),
-                        },
-                    }
-                )
-                current_keys = []
-                current_start = event.timestamp_ms
-
-            if not current_keys:
-                current_start = event.timestamp_ms
-
-            current_keys.append(key)
-
-        # Don't forget last sequence
-        if current_keys:
-            sequences.append(
-                {
-                    "type": "keystroke_sequence",
-                    "timestamp_ms": current_start,
-                    "data": {
-                        "keys": current_keys.copy(),
-                        "reconstructed": "".join(current_keys),
-                    },
-                }
-            )
-
-        return sequences
+        return {
+            "type": "keystroke_sequence",
+            "timestamp_ms": start_ms,
+            "data": {
+                "keys": keys,
+                "reconstructed": "".join(keys),
+            },
+        }
 
-    def generate(self) -> dict:
-        """Generate JSON-serializable dictionary."""
-        events = sorted(self.timeline.events, key=lambda e: e.timestamp_ms)
+    def _iter_events(self, counts: dict[str, int]) -> Iterator[dict]:
+        """Yield JSON-serializable events in timestamp order.
 
-        # Convert events to JSON-serializable format
-        json_events = []
-        for event in events:
-            # Skip individual keystrokes - we'll add sequences instead
-            if event.type == EventType.KEYSTROKE:
+        Statistics are gathered in the same pass and stored in counts once the
+        iterator is exhausted.
+        """
+        # Keystrokes are grouped into sequences of keys within 2 seconds of the
+        # sequence's first key. Each sequence is placed at that first key's
+        # timestamp (after other events with the same time).
+        sequences = self.timeline.keystroke_sequences(2000)
+        seq_iter = iter(sequences)
+        next_seq = next(seq_iter, None)
+        word_count = 0
+        screenshots_count = 0
+        clipboard_events_count = 0
+        # Enum members are singletons: bind them once and compare by identity
+        KEYSTROKE = EventType.KEYSTROKE
+        TRANSCRIPT = EventType.TRANSCRIPT
+        SCREENSHOT = EventType.SCREENSHOT
+        CLIPBOARD = EventType.CLIPBOARD
+        for event in self.timeline.sorted_events():
+            event_type = event.type
+            if event_type is KEYSTROKE:
                 continue
+            ts = event.timestamp_ms
+
+            while next_seq is not None and next_seq[0] < ts:
+                start_ms, keystrokes = next_seq
+                yield self._keystroke_sequence(start_ms, [e.key for e in keystrokes])
+                next_seq = next(seq_iter, None)
+
+            if event_type is TRANSCRIPT:
+                if not event.is_partial:
+                    word_count += event.word_count
+            elif event_type is SCREENSHOT:
+                screenshots_count += 1
+            elif event_type is CLIPBOARD:
+                clipboard_events_count += 1
+
+            yield {
+                "type": event_type.value,
+                "timestamp_ms": ts,
+                "data": event.data,
+            }
+
+        # Sequences after the last other event
+        while next_seq is not None:
+            start_ms, keystrokes = next_seq
+            yield self._keystroke_sequence(start_ms, [e.key for e in keystrokes])
+            next_seq = next(seq_iter, None)
+
+        counts["word_count"] = word_count
+        counts["screenshots_count"] = screenshots_count
+        counts["clipboard_events_count"] = clipboard_events_count
+        counts["keystroke_sequences_count"] = len(sequences)
+
+    def _session_info(self) -> dict:
+        """Session metadata block."""
+        return {
+            "id": self.timeline.session_id,
+            "started_at": (
+                self.timeline.started_at.isoformat() if self.timeline.started_at else None
+            ),
+            "ended_at": (self.timeline.ended_at.isoformat() if self.timeline.ended_at else None),
+            "duration_ms": self.timeline.duration_ms,
+            "config": {
+                "whisper_model": self.config.whisper_model,
+                "audio_device": self.config.audio_device,
+                "sample_rate": self.config.sample_rate,
+            },
+        }
+
+    def _statistics(self, counts: dict[str, int]) -> dict:
+        """Statistics block, from the counts gathered by _iter_events."""
+        return {
+            "total_transcribed_words": counts["word_count"],
+            "full_transcript_words": len(self.full_transcript.split())
+            if self.full_transcript
+            else 0,
+            "screenshots_count": counts["screenshots_count"],
+            "clipboard_events_count": counts["clipboard_events_count"],
+            "keystroke_sequences_count": counts["keystroke_sequences_count"],
+        }
 
-            json_events.append(
-                {
-                    "type": event.type.value,
-                    "timestamp_ms": event.timestamp_ms,
-                    "data": event.data,
-                }
-            )
-
-        # Add keystroke sequences
-        keystroke_sequences = self._reconstruct_keystroke_sequences(events)
-        json_events.extend(keystroke_sequences)
-
-        # Sort by timestamp again after adding sequences
-        json_events.sort(key=lambda e: e["timestamp_ms"])
-
-        # Calculate statistics
-        transcript_events = [e for e in events if e.type == EventType.TRANSCRIPT]
-        word_count = sum(
-            len(e.data.get("text", "").split())
-            for e in transcript_events
-            if not e.data.get("is_partial", False)
-        )
+    def generate(self) -> dict:
+        """Generate JSON-serializable dictionary."""
+        counts: dict[str, int] = {}
+        json_events = list(self._iter_events(counts))
 
         result = {
-            "session": {
-                "id": self.timeline.session_id,
-                "started_at": (
-                    self.timeline.started_at.isoformat() if self.timeline.started_at else None
-                ),
-                "ended_at": (
-                    self.timeline.ended_at.isoformat() if self.timeline.ended_at else None
-                ),
-                "duration_ms": self.timeline.duration_ms,
-                "config": {
-                    "whisper_model": self.config.whisper_model,
-                    "audio_device": self.config.audio_device,
-                    "sample_rate": self.config.sample_rate,
-                },
-            },
+            "session": self._session_info(),
             "full_transcript": self.full_transcript,
             "events": json_events,
-            "statistics": {
-                "total_transcribed_words": word_count,
-                "full_transcript_words": len(self.full_transcript.split())
-                if self.full_transcript
-                else 0,
-                "screenshots_count": len([e for e in events if e.type == EventType.SCREENSHOT]),
-                "clipboard_events_count": len([e for e in events if e.type == EventType.CLIPBOARD]),
-                "keystroke_sequences_count": len(keystroke_sequences),
-            },
+            "statistics": self._statistics(counts),
         }
 
         return result
 
     def save(self, path: Path):
-        """Save JSON to file."""
-        content = self.generate()
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(content, f, indent=2, ensure_ascii=False)
+        """Save JSON to file.
+
+        Events are serialized one at a time as they're generated, so the whole
+        document is never held in memory. The file is equivalent JSON to
+        json.dump(self.generate(), f, indent=2, ensure_ascii=False), and
+        identical when orjson isn't installed.
+        """
+        counts: dict[str, int] = {}
+        with open(path, "wb") as f:
+            f.write(b'{\n  "session": ' + _dumps(self._session_info(), 1))
+            f.write(b',\n  "full_transcript": ' + _dumps(self.full_transcript, 1))
+            f.write(b',\n  "events": [')
+            first = True
+            for json_event in self._iter_events(counts):
+                f.write(b"\n    " if first else b",\n    ")
+                f.write(_dumps(json_event, 2))
+                first = False
+            f.write(b"]" if first else b"\n  ]")
+            f.write(b',\n  "statistics": ' + _dumps(self._statistics(counts), 1) + b"\n}")
@@ -1,5 +1,6 @@
 """Markdown output generator."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Optional
 
@@ -22,178 +23,159 @@ class MarkdownOutputGenerator:
         self.config = config
         self.full_transcript = full_transcript or ""
         self.session_dir = session_dir
+        # Resolved once here rather than on every render (it hits the filesystem)
+        self._session_dir_str = str(session_dir.resolve()) if session_dir else None
+        # Formatted timestamps by whole second; busy sessions repeat them a lot
+        self._ts_cache: dict[int, str] = {}
 
     def _format_timestamp(self, ms: int) -> str:
         """Format milliseconds as [HH:MM:SS]."""
         seconds = ms // 1000
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"[{hours:02d}:{minutes:02d}:{secs:02d}]"
-
-    def _reconstruct_keystrokes(self, events: list) -> list[tuple[int, str]]:
-        """Reconstruct keystroke sequences from individual keystroke events.
-
-        Groups keystrokes that occur within 2 seconds of each other.
-        Returns list of (timestamp_ms, reconstructed_text) tuples.
+        formatted = self._ts_cache.get(seconds)
+        if formatted is None:
+            hours, rem = divmod(seconds, 3600)
+            minutes, secs = divmod(rem, 60)
+            formatted = f"[{hours:02d}:{minutes:02d}:{secs:02d}]"
+            self._ts_cache[seconds] = formatted
+        return formatted
+
+    def _iter_lines(self) -> Iterator[str]:
+        """Yield the Markdown document in pieces, mostly whole lines.
+
+        Joining the pieces gives the document; nothing is inserted between them.
         """
-        keystroke_events = [e for e in events if e.type == EventType.KEYSTROKE]
-        if not keystroke_events:
-            return []
-
-        sequences = []
-        current_seq = []
-        current_start = keystroke_events[0].timestamp_ms
-
-        for event in keystroke_events:
-            key = event.data["key"]
-            is_special = event.data["is_special"]
-
-            # Start new sequence if gap > 2 seconds
-            if current_seq and (event.timestamp_ms - current_start > 2000):
-                # Save current sequence
-                reconstructed = self._keys_to_text(current_seq)
-                if reconstructed.strip():
-                    sequences.append((current_start, reconstructed))
-                current_seq = []
-                current_start = event.timestamp_ms
-
-            if not current_seq:
-                current_start = event.timestamp_ms
-
-            current_seq.append((key, is_special))
-
-        # Don't forget last sequence
-        if current_seq:
-            reconstructed = self._keys_to_text(current_seq)
-            if reconstructed.strip():
-                sequences.append((current_start, reconstructed))
-
-        return sequences
-
-    def _keys_to_text(self, keys: list[tuple[str, bool]]) -> str:
-        """Convert list of (key, is_special) to readable text."""
-        result = []
-        for key, is_special in keys:
-            if is_special:
-                # Show special keys in brackets
-                result.append(key)
-            else:
-                result.append(key)
-        return "".join(result)
-
-    def generate(self) -> str:
-        """Generate Markdown content."""
-        lines = []
-
         # Header
-        lines.append("# Recording Session")
-        lines.append("")
+        yield "# Recording Session\n"
+        yield "\n"
 
-        if self.session_dir:
-            lines.append(f"**Session Directory**: `{self.session_dir.resolve()}`")
+        if self._session_dir_str:
+            yield f"**Session Directory**: `{self._session_dir_str}`\n"
 
         if self.timeline.started_at:
-            lines.append(f"**Started**: {self.timeline.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            yield f"**Started**: {self.timeline.started_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
 
         duration_s = self.timeline.duration_ms // 1000
         mins, secs = divmod(duration_s, 60)
-        lines.append(f"**Duration**: {mins} minutes {secs} seconds")
-        lines.append(f"**Model**: whisper-{self.config.whisper_model}")
-        lines.append("")
+        yield f"**Duration**: {mins} minutes {secs} seconds\n"
+        yield f"**Model**: whisper-{self.config.whisper_model}\n"
+        yield "\n"
 
         # Full transcript section (from second-pass transcription)
         if self.full_transcript:
-            lines.append("## Full Transcript")
-            lines.append("")
-            lines.append(self.full_transcript)
-            lines.append("")
-
-        lines.append("---")
-        lines.append("")
-        lines.append("## Timeline")
-        lines.append("")
-
-        # Process events in chronological order
-        events = sorted(self.timeline.events, key=lambda e: e.timestamp_ms)
-
-        # Get keystroke sequences
-        keystroke_sequences = self._reconstruct_keystrokes(events)
+            yield "## Full Transcript\n"
+            yield "\n"
+            yield self.full_transcript + "\n"
+            yield "\n"
+
+        yield "---\n"
+        yield "\n"
+        yield "## Timeline\n"
+        yield "\n"
+
+        # Process events in chronological order. Keystrokes are listed in their
+        # own section after the timeline.
+        events = self.timeline.sorted_events()
+
+        # Enum members are singletons: bind them once and compare by identity
+        KEYSTROKE = EventType.KEYSTROKE
+        TRANSCRIPT = EventType.TRANSCRIPT
+        SCREENSHOT = EventType.SCREENSHOT
+        CLIPBOARD = EventType.CLIPBOARD
+        SESSION_START = EventType.SESSION_START
+        SESSION_END = EventType.SESSION_END
 
         for event in events:
+            event_type = event.type
+            if event_type is KEYSTROKE:
+                continue
+
             ts = self._format_timestamp(event.timestamp_ms)
 
-            if event.type == EventType.SESSION_START:
-                lines.append(f"### {ts} Session Started")
-                lines.append("")
-
-            elif event.type == EventType.TRANSCRIPT:
-                text = event.data.get("text", "")
-                if text and not event.data.get("is_partial", False):
-                    lines.append(f"### {ts} Transcript")
-                    lines.append(f"> {text}")
-                    lines.append("")
-
-            elif event.type == EventType.SCREENSHOT:
-                filename = event.data.get("filename", "")
-                trigger = event.data.get("trigger", "hotkey")
-                lines.append(f"### {ts} Screenshot")
-                lines.append(f"![Screenshot]({filename})")
-                lines.append(f"*Triggered by: {trigger}*")
-                lines.append("")
-
-            elif event.type == EventType.CLIPBOARD:
-                content = event.data.get("content", "")
+            if event_type is SESSION_START:
+                yield f"### {ts} Session Started\n"
+                yield "\n"
+
+            elif event_type is TRANSCRIPT:
+                text = event.text
+                if text and not event.is_partial:
+                    yield f"### {ts} Transcript\n"
+                    yield f"> {text}\n"
+                    yield "\n"
+
+            elif event_type is SCREENSHOT:
+                filename = event.filename
+                trigger = event.trigger
+                yield f"### {ts} Screenshot\n"
+                yield f"![Screenshot]({filename})\n"
+                yield f"*Triggered by: {trigger}*\n"
+                yield "\n"
+
+            elif event_type is CLIPBOARD:
+                content = event.content
                 if content:
-                    lines.append(f"### {ts} Clipboard")
-                    # Truncate very long clipboard content
+                    yield f"### {ts} Clipboard\n"
+                    yield "```\n"
+                    # Truncate very long clipboard content; the pieces are
+                    # written separately instead of concatenated into a copy
                     if len(content) > 500:
-                        content = content[:500] + "..."
-                    lines.append("```")
-                    lines.append(content)
-                    lines.append("```")
-                    lines.append("")
-
-            elif event.type == EventType.SESSION_END:
-                lines.append(f"### {ts} Session Ended")
-                lines.append("")
+                        yield content[:500]
+                        yield "...\n"
+                    else:
+                        yield content
+                        yield "\n"
+                    yield "```\n"
+                    yield "\n"
+
+            elif event_type is SESSION_END:
+                yield f"### {ts} Session Ended\n"
+                yield "\n"
+
+        # Group keystrokes into sequences of keys within 2 seconds of the
+        # sequence's first key
+        keystroke_sequences: list[tuple[int, str]] = []
+        for seq_start, keystrokes in self.timeline.keystroke_sequences(2000):
+            reconstructed = "".join([e.key for e in keystrokes])
+            if reconstructed.strip():
+                keystroke_sequences.append((seq_start, reconstructed))
 
         # Add keystroke sequences section if any
         if keystroke_sequences:
-            lines.append("## Keystroke Sequences")
-            lines.append("")
+            yield "## Keystroke Sequences\n"
+            yield "\n"
             for ts_ms, text in keystroke_sequences:
                 ts = self._format_timestamp(ts_ms)
                 # Escape backticks in the text
                 escaped = text.replace("`", "\\`")
-                lines.append(f"- {ts} `{escaped}`")
-            lines.append("")
+                yield f"- {ts} `{escaped}`\n"
+            yield "\n"
 
         # Summary statistics
-        lines.append("---")
-        lines.append("")
-        lines.append("## Summary Statistics")
-        lines.append("")
+        yield "---\n"
+        yield "\n"
+        yield "## Summary Statistics\n"
+        yield "\n"
 
-        transcript_events = [e for e in events if e.type == EventType.TRANSCRIPT]
-        word_count = sum(
-            len(e.data.get("text", "").split())
-            for e in transcript_events
-            if not e.data.get("is_partial", False)
-        )
+        # The timeline's per-type index saves three more scans over all events
+        transcript_events = self.timeline.get_events_by_type(TRANSCRIPT)
+        word_count = sum(e.word_count for e in transcript_events if not e.is_partial)
 
-        screenshot_count = len([e for e in events if e.type == EventType.SCREENSHOT])
-        clipboard_count = len([e for e in events if e.type == EventType.CLIPBOARD])
+        screenshot_count = len(self.timeline.get_events_by_type(SCREENSHOT))
+        clipboard_count = len(self.timeline.get_events_by_type(CLIPBOARD))
 
-        lines.append(f"- Total transcribed words: {word_count}")
-        lines.append(f"- Screenshots taken: {screenshot_count}")
-        lines.append(f"- Clipboard events: {clipboard_count}")
-        lines.append(f"- Keystroke sequences logged: {len(keystroke_sequences)}")
-        lines.append("")
+        yield f"- Total transcribed words: {word_count}\n"
+        yield f"- Screenshots taken: {screenshot_count}\n"
+        yield f"- Clipboard events: {clipboard_count}\n"
+        yield f"- Keystroke sequences logged: {len(keystroke_sequences)}\n"
 
-        return "\n".join(lines)
+    def generate(self) -> str:
+        """Generate Markdown content."""
+        return "".join(self._iter_lines())
 
     def save(self, path: Path):
-        """Save Markdown to file."""
-        content = self.generate()
-        path.write_text(content, encoding="utf-8")
+        """Save Markdown to file.
+
+        Lines are written through a buffered file as they're generated instead
+        of being joined into one string first.
+        """
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(self._iter_lines())
@@ -1,21 +1,42 @@
 """macOS-specific utilities for ultraplan."""
 
+import ctypes
+import functools
 import platform
 import subprocess
 import sys
-from typing import Optional
+import threading
+from typing import Any, Optional
 
 from rich.console import Console
 from rich.panel import Panel
 
+try:
+    from AppKit import NSSound
+
+    _HAS_APPKIT = True
+except ImportError:
+    # AppKit not available (not macOS or pyobjc not installed)
+    _HAS_APPKIT = False
+
 console = Console()
 
+IS_MACOS = platform.system() == "Darwin"
+
+# Loaded system sounds by name, so each is read from disk only once
+_SOUND_CACHE: dict[str, Any] = {}
+
+# The last afplay process started by play_sound (when AppKit isn't available)
+_afplay_proc: Optional[subprocess.Popen] = None
+_afplay_lock = threading.Lock()
+
 
 def is_macos() -> bool:
     """Check if running on macOS."""
-    return platform.system() == "Darwin"
+    return IS_MACOS
 
 
+@functools.lru_cache(maxsize=None)
 def check_blackhole_installed() -> bool:
     """Check if BlackHole virtual audio driver is installed."""
     try:
@@ -30,29 +51,38 @@ def check_blackhole_installed() -> bool:
         return False
 
 
+def _ax_is_process_trusted() -> Optional[bool]:
+    """Ask the Accessibility API whether this process is trusted.
+
+    This is the same check pynput makes before printing its "not trusted"
+    warning. Returns None if the framework can't be loaded.
+    """
+    try:
+        services = ctypes.cdll.LoadLibrary(
+            "/System/Library/Frameworks/ApplicationServices.framework/ApplicationServices"
+        )
+        ax_is_process_trusted = services.AXIsProcessTrusted
+        ax_is_process_trusted.restype = ctypes.c_bool
+        ax_is_process_trusted.argtypes = []
+        return bool(ax_is_process_trusted())
+    except (OSError, AttributeError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
 def check_accessibility_permission() -> bool:
     """Check if app has accessibility permissions for keyboard monitoring.
 
-    This performs a real test by trying to capture keyboard events.
-    Uses AppleScript to check the actual permission state on macOS.
+    Asks the Accessibility API directly (no prompt, returns immediately). If
+    that isn't available, falls back to starting a pynput listener and
+    watching for its "not trusted" warning.
     """
-    if not is_macos():
+    if not IS_MACOS:
         return True  # Assume OK on non-macOS
 
-    # First, try the AppleScript-based check which is more reliable
-    try:
-        # This AppleScript will prompt for permission if not granted
-        # We just want to check, not prompt, so we use a different approach
-        subprocess.run(
-            ["osascript", "-e", 'tell application "System Events" to return (UI elements enabled)'],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        # If we get "true", accessibility is enabled for something
-        # But this doesn't guarantee our specific app has permission
-    except Exception:
-        pass
+    trusted = _ax_is_process_trusted()
+    if trusted is not None:
+        return trusted
 
     # Capture stderr to detect the "not trusted" warning from pynput
     import io
@@ -88,9 +118,10 @@ def check_accessibility_permission() -> bool:
         sys.stderr = old_stderr
 
 
+@functools.lru_cache(maxsize=None)
 def check_screen_recording_permission() -> bool:
     """Check if app has screen recording permissions for screenshots."""
-    if not is_macos():
+    if not IS_MACOS:
         return True
 
     try:
@@ -115,17 +146,39 @@ def play_sound(sound_name: str = "Ping") -> None:
     Available sounds: Basso, Blow, Bottle, Frog, Funk, Glass, Hero,
     Morse, Ping, Pop, Purr, Sosumi, Submarine, Tink
     """
-    if not is_macos():
+    if not IS_MACOS:
         # Terminal bell fallback
         print("\a", end="", flush=True)
         return
 
+    # Play in-process with a cached NSSound; this returns immediately instead
+    # of spawning afplay and waiting for the sound to finish
+    if _HAS_APPKIT:
+        sound = _SOUND_CACHE.get(sound_name)
+        if sound is None:
+            sound = NSSound.soundNamed_(sound_name)
+            if sound is not None:
+                _SOUND_CACHE[sound_name] = sound
+        if sound is not None:
+            if sound.isPlaying():
+                sound.stop()  # Restart so back-to-back events each get a sound
+            sound.play()
+            return
+
+    global _afplay_proc
     try:
-        subprocess.run(
-            ["afplay", f"/System/Library/Sounds/{sound_name}.aiff"],
-            capture_output=True,
-            timeout=2,
-        )
+        with _afplay_lock:
+            # Don't wait for afplay to finish. Stopping (and reaping) the
+            # previous one restarts the sound like the NSSound path does and
+            # leaves no zombie processes behind.
+            if _afplay_proc is not None and _afplay_proc.poll() is None:
+                _afplay_proc.terminate()
+                _afplay_proc.wait()
+            _afplay_proc = subprocess.Popen(
+                ["afplay", f"/System/Library/Sounds/{sound_name}.aiff"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
     except Exception:
         print("\a", end="", flush=True)  # Fallback to terminal bell
 
@@ -144,18 +197,23 @@ def send_notification(
         sound: Whether to play a sound
         subtitle: Optional subtitle
     """
-    if not is_macos():
+    if not IS_MACOS:
         console.print(f"[bold]{title}[/bold]: {message}")
         return
 
-    sound_str = 'sound name "Ping"' if sound else ""
-    subtitle_str = f'subtitle "{subtitle}"' if subtitle else ""
-
-    script = f'display notification "{message}" with title "{title}" {subtitle_str} {sound_str}'
+    # Text is passed as script arguments (argv) rather than spliced into the
+    # source, so quotes or backslashes in it can't break or alter the script
+    script = "display notification (item 2 of argv) with title (item 1 of argv)"
+    args = [title, message]
+    if subtitle:
+        script += " subtitle (item 3 of argv)"
+        args.append(subtitle)
+    if sound:
+        script += ' sound name "Ping"'
 
     try:
         subprocess.run(
-            ["osascript", "-e", script],
+            ["osascript", "-e", "on run argv", "-e", script, "-e", "end run", *args],
             capture_output=True,
             timeout=5,
         )
@@ -216,7 +274,7 @@ while ultraplan captures it via BlackHole.
 
 def check_setup():
     """Check macOS setup and display status."""
-    if not is_macos():
+    if not IS_MACOS:
         console.print("[yellow]Note: This setup guide is for macOS.[/yellow]")
         console.print("For other platforms, consult your OS documentation for audio routing.")
         return
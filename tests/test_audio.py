@@ -0,0 +1,36 @@
+"""Tests for the audio capture ring buffer."""
+
+import numpy as np
+
+from ultraplan.capture.audio import AudioCapture
+
+
+def _capture() -> AudioCapture:
+    # 10-frame chunks in a 40-frame ring
+    return AudioCapture(sample_rate=100, chunk_duration=0.1, ring_duration=0.4)
+
+
+def _frames(start: int, n: int) -> np.ndarray:
+    return np.arange(start, start + n, dtype=np.float32).reshape(-1, 1)
+
+
+def test_get_chunk_reads_across_ring_wrap():
+    capture = _capture()
+    capture._audio_callback(_frames(0, 30), 30, None, None)
+    assert capture.get_chunk(timeout=0).ravel().tolist() == list(range(30))
+
+    # Frames 30-59 wrap around the end of the 40-frame ring
+    capture._audio_callback(_frames(30, 30), 30, None, None)
+    assert capture.get_chunk(timeout=0).ravel().tolist() == list(range(30, 60))
+    assert capture.dropped_frames == 0
+
+
+def test_get_chunk_counts_overwritten_frames():
+    capture = _capture()
+    for start in range(0, 100, 10):
+        capture._audio_callback(_frames(start, 10), 10, None, None)
+
+    # Only the newest ring's worth survives; the rest is counted as dropped
+    assert capture.get_chunk(timeout=0).ravel().tolist() == list(range(60, 100))
+    assert capture.dropped_frames == 60
+    assert capture.get_chunk(timeout=0) is None
@@ -0,0 +1,18 @@
+"""Tests for the clipboard monitor."""
+
+import time
+
+from ultraplan.capture.clipboard import ClipboardMonitor
+
+
+def test_stop_interrupts_idle_backoff(monkeypatch):
+    monitor = ClipboardMonitor(poll_interval=2.0, max_poll_interval=5.0)
+    monkeypatch.setattr(monitor, "_check_clipboard", lambda: False)
+    monitor.start(time.time())
+    time.sleep(0.1)  # The loop is now in its first (backed-off, 2.5 s) wait
+    thread = monitor.thread
+
+    started = time.monotonic()
+    monitor.stop()
+    assert time.monotonic() - started < 0.5
+    assert not thread.is_alive()
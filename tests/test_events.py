@@ -2,6 +2,7 @@
 
 from ultraplan.core.events import (
     ClipboardEvent,
+    Event,
     EventType,
     KeystrokeEvent,
     ScreenshotEvent,
@@ -20,6 +21,8 @@ def test_transcript_event():
     assert event.timestamp_ms == 1000
     assert event.text == "Hello world"
     assert event.data["confidence"] == 0.95
+    assert event.word_count == 2
+    assert "word_count" not in event.data
 
 
 def test_keystroke_event():
@@ -50,3 +53,15 @@ def test_screenshot_event():
     )
     assert event.type == EventType.SCREENSHOT
     assert event.filename == "img_003000.png"
+
+
+def test_events_use_slots():
+    event = KeystrokeEvent(timestamp_ms=500, key="a")
+    assert not hasattr(event, "__dict__")
+    assert event.data == {"key": "a", "is_special": False}
+
+
+def test_base_event_takes_data():
+    event = Event(type=EventType.SESSION_START, timestamp_ms=0, data={"note": "hi"})
+    assert event.data == {"note": "hi"}
+    assert Event(type=EventType.SESSION_END, timestamp_ms=5).data == {}
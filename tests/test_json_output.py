@@ -0,0 +1,50 @@
+"""Tests for JSON output."""
+
+import json
+
+import numpy as np
+
+from ultraplan.config import SessionConfig
+from ultraplan.core.events import ClipboardEvent, KeystrokeEvent, TranscriptEvent
+from ultraplan.core.timeline import Timeline
+from ultraplan.output.json_output import JSONOutputGenerator
+
+
+def test_save_matches_json_dump(tmp_path):
+    timeline = Timeline()
+    timeline.add_events(
+        [
+            KeystrokeEvent(timestamp_ms=100, key="h"),
+            TranscriptEvent(timestamp_ms=500, text="hello there"),
+            KeystrokeEvent(timestamp_ms=900, key="i"),
+            ClipboardEvent(timestamp_ms=4000, content='line one\nline "two" é'),
+        ]
+    )
+    generator = JSONOutputGenerator(timeline, SessionConfig(), full_transcript="hello there")
+
+    path = tmp_path / "recording.json"
+    generator.save(path)
+
+    expected = json.dumps(generator.generate(), indent=2, ensure_ascii=False)
+    assert path.read_text(encoding="utf-8") == expected
+    # The keystroke sequence sits at its first key, before the transcript
+    assert [e["type"] for e in json.loads(expected)["events"]] == [
+        "keystroke_sequence",
+        "transcript",
+        "clipboard",
+    ]
+
+
+def test_save_empty_timeline(tmp_path):
+    generator = JSONOutputGenerator(Timeline(), SessionConfig())
+    path = tmp_path / "recording.json"
+    generator.save(path)
+    assert path.read_text(encoding="utf-8") == json.dumps(generator.generate(), indent=2)
+
+
+def test_save_numpy_confidence(tmp_path):
+    timeline = Timeline()
+    timeline.add_event(TranscriptEvent(timestamp_ms=0, text="hi", confidence=np.float64(0.5)))
+    path = tmp_path / "recording.json"
+    JSONOutputGenerator(timeline, SessionConfig()).save(path)
+    assert json.loads(path.read_text(encoding="utf-8"))["events"][0]["data"]["confidence"] == 0.5
@@ -0,0 +1,20 @@
+"""Tests for recording session callbacks."""
+
+from ultraplan.config import SessionConfig
+from ultraplan.core.session import RecordingSession
+
+
+def test_clipboard_image_event_only_after_write(tmp_path):
+    # No I/O pool (as after stop()), so the image is written synchronously
+    session = RecordingSession(SessionConfig())
+    session.session_dir = tmp_path
+    session._on_clipboard_image(b"png", 1234)
+    assert (tmp_path / "clip_001234.png").read_bytes() == b"png"
+    assert [e.filename for e in session._events] == ["clip_001234.png"]
+
+    # A failed write records nothing
+    session._events.clear()
+    session.session_dir = tmp_path / "missing"
+    session._on_clipboard_image(b"png", 5678)
+    assert not session._events
+    assert session.screenshots == ["clip_001234.png"]
@@ -0,0 +1,90 @@
+"""Tests for the session timeline."""
+
+from ultraplan.core.events import EventType, KeystrokeEvent, TranscriptEvent
+from ultraplan.core.timeline import Timeline
+
+
+def test_get_events_by_type():
+    timeline = Timeline()
+    first = TranscriptEvent(timestamp_ms=100, text="one")
+    key = KeystrokeEvent(timestamp_ms=150, key="a")
+    second = TranscriptEvent(timestamp_ms=200, text="two")
+    for event in (first, key, second):
+        timeline.add_event(event)
+
+    assert timeline.get_events_by_type(EventType.TRANSCRIPT) == [first, second]
+    assert timeline.get_events_by_type(EventType.KEYSTROKE) == [key]
+    assert timeline.get_events_by_type(EventType.SCREENSHOT) == []
+    # Looking up a missing type must not add it to the index
+    assert EventType.SCREENSHOT not in timeline._by_type
+
+
+def test_add_events_matches_add_event():
+    events = [
+        TranscriptEvent(timestamp_ms=100, text="one"),
+        KeystrokeEvent(timestamp_ms=150, key="a"),
+        TranscriptEvent(timestamp_ms=200, text="two"),
+    ]
+    timeline = Timeline()
+    timeline.add_events(events)
+
+    assert timeline.events == events
+    assert timeline.get_events_by_type(EventType.TRANSCRIPT) == [events[0], events[2]]
+
+
+def test_sorted_events_orders_late_arrivals():
+    timeline = Timeline()
+    late = KeystrokeEvent(timestamp_ms=100, key="a")
+    first = TranscriptEvent(timestamp_ms=100, text="one")
+    timeline.add_event(first)
+    timeline.add_event(TranscriptEvent(timestamp_ms=300, text="two"))
+    timeline.add_events([late, KeystrokeEvent(timestamp_ms=50, key="b")])
+
+    timestamps = [e.timestamp_ms for e in timeline.sorted_events()]
+    assert timestamps == [50, 100, 100, 300]
+    # Equal timestamps keep their arrival order
+    assert timeline.sorted_events()[1:3] == [first, late]
+
+
+def test_keystroke_sequences_group_from_first_key():
+    timeline = Timeline()
+    # Added out of order, and enough events to grow the timestamp buffer
+    timeline.add_events([KeystrokeEvent(timestamp_ms=2500 + i, key="c") for i in range(100)])
+    timeline.add_events(
+        [
+            KeystrokeEvent(timestamp_ms=0, key="a"),
+            TranscriptEvent(timestamp_ms=1000, text="one"),
+            KeystrokeEvent(timestamp_ms=2000, key="b"),
+        ]
+    )
+
+    sequences = timeline.keystroke_sequences(2000)
+    assert [start for start, _ in sequences] == [0, 2500]
+    assert [e.key for e in sequences[0][1]] == ["a", "b"]
+    assert len(sequences[1][1]) == 100
+
+
+def test_timelines_compare_by_events():
+    assert Timeline() == Timeline()
+    timeline = Timeline()
+    timeline.add_event(KeystrokeEvent(timestamp_ms=0, key="a"))
+    assert timeline == Timeline(events=[KeystrokeEvent(timestamp_ms=0, key="a")])
+    assert timeline != Timeline()
+
+
+def test_indexes_follow_direct_changes_to_events():
+    timeline = Timeline()
+    timeline.add_event(TranscriptEvent(timestamp_ms=0, text="zero"))
+    timeline.events.append(KeystrokeEvent(timestamp_ms=100, key="a"))
+    timeline.events.append(KeystrokeEvent(timestamp_ms=200, key="b"))
+    transcript = TranscriptEvent(timestamp_ms=50, text="one")
+    timeline.events.append(transcript)
+
+    assert timeline.get_events_by_type(EventType.TRANSCRIPT)[-1] is transcript
+    sequences = timeline.keystroke_sequences(2000)
+    assert [(start, [e.key for e in keys]) for start, keys in sequences] == [(100, ["a", "b"])]
+    assert [e.timestamp_ms for e in timeline.sorted_events()] == [0, 50, 100, 200]
+
+    # Adding through the API afterwards keeps everything consistent
+    timeline.add_event(KeystrokeEvent(timestamp_ms=300, key="c"))
+    assert [e.key for e in timeline.keystroke_sequences(2000)[0][1]] == ["a", "b", "c"]
@@ -0,0 +1,35 @@
+"""Tests for fuzzy voice command matching."""
+
+from ultraplan.config import SessionConfig
+from ultraplan.core.session import RecordingSession, _edit_distance, _sounds_like
+
+
+def test_edit_distance():
+    assert _edit_distance("finito", "finito", 2) == 0
+    assert _edit_distance("pinito", "finito", 2) == 1
+    assert _edit_distance("", "abc", 2) == 3
+
+
+def test_edit_distance_stops_past_max():
+    # Real distance is 6; anything above max_distance is reported as max + 1
+    assert _edit_distance("abcdef", "uvwxyz", 2) == 3
+
+
+def test_sounds_like_mistranscriptions():
+    assert _sounds_like("Okay, Pinito.", "finito")
+    assert _sounds_like("fenito", "finito")
+    assert not _sounds_like("hello world", "finito")
+
+
+def test_filter_voice_commands():
+    session = RecordingSession(SessionConfig(voice_trigger="marco", voice_stop="finito"))
+    text = "Look at this, Marco. The button is broken. Okay Pinito."
+    assert session._filter_voice_commands(text) == "Look at this, The button is broken. Okay"
+
+
+def test_voice_commands_after_io_pool_shutdown():
+    # A final transcript can arrive after stop() has shut the I/O pool down
+    session = RecordingSession(SessionConfig(voice_trigger="marco", voice_stop="finito"))
+    session._on_transcript("Marco, finito.", 0.9, False)
+    assert session._voice_stop.is_set()
+    assert session.screenshots == []